@@ -50,14 +50,23 @@ def monkey_session() -> Generator[MonkeyPatch]:
     mp.undo()
 
 
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Run every async test on the session loop the async fixtures already use."""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
 @pytest.fixture(scope="session")
-def event_loop() -> Generator[asyncio.AbstractEventLoop]:
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run the suite on uvloop where it is installed (comes with uvicorn[standard])."""
     try:
-        yield loop
-    finally:
-        loop.close()
+        import uvloop
+    except ImportError:  # Windows, PyPy
+        return asyncio.DefaultEventLoopPolicy()
+    policy: asyncio.AbstractEventLoopPolicy = uvloop.EventLoopPolicy()
+    return policy
 
 
 @pytest.fixture(scope="session")
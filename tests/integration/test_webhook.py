@@ -1,11 +1,12 @@
 """Integration tests for Telegram webhook endpoint."""
 
-from collections.abc import AsyncGenerator
-from unittest.mock import AsyncMock, MagicMock, patch
+from collections.abc import Generator
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from fastapi import FastAPI
-from httpx import ASGITransport, AsyncClient
+from fastapi.testclient import TestClient
 
 from src.bot.webhook import router
 
@@ -14,7 +15,7 @@ HTTP_FORBIDDEN = 403
 SAMPLE_UPDATE_ID = 123456789
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_app() -> FastAPI:
     """Create test FastAPI app with webhook router."""
     app = FastAPI()
@@ -22,12 +23,23 @@ def test_app() -> FastAPI:
     return app
 
 
+@pytest.fixture(scope="session")
+def client(test_app: FastAPI) -> Generator[TestClient]:
+    """Create in-process test client."""
+    with TestClient(test_app, base_url="http://test") as tc:
+        yield tc
+
+
 @pytest.fixture
-async def client(test_app: FastAPI) -> AsyncGenerator[AsyncClient]:
-    """Create async test client."""
-    transport = ASGITransport(app=test_app)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
-        yield ac
+def mock_bot() -> object:
+    """Opaque bot instance; the webhook only passes it through."""
+    return object()
+
+
+@pytest.fixture
+def mock_dispatcher() -> SimpleNamespace:
+    """Dispatcher stand-in exposing only `feed_update`."""
+    return SimpleNamespace(feed_update=AsyncMock())
 
 
 # Sample update data for testing
@@ -46,14 +58,14 @@ SAMPLE_UPDATE = {
 class TestTelegramWebhook:
     """Tests for telegram_webhook endpoint."""
 
-    async def test_webhook_rejects_invalid_secret(self, client: AsyncClient) -> None:
+    def test_webhook_rejects_invalid_secret(self, client: TestClient) -> None:
         """Webhook rejects request with invalid secret token."""
         with (
             patch("src.bot.webhook.settings") as mock_settings,
         ):
             mock_settings.telegram.webhook_secret.get_secret_value.return_value = "correct-secret"
 
-            response = await client.post(
+            response = client.post(
                 "/telegram/webhook",
                 json=SAMPLE_UPDATE,
                 headers={"X-Telegram-Bot-Api-Secret-Token": "wrong-secret"},
@@ -62,12 +74,13 @@ class TestTelegramWebhook:
         assert response.status_code == HTTP_FORBIDDEN
         assert "Invalid secret token" in response.json()["detail"]
 
-    async def test_webhook_accepts_valid_secret(self, client: AsyncClient) -> None:
+    def test_webhook_accepts_valid_secret(
+        self,
+        client: TestClient,
+        mock_bot: object,
+        mock_dispatcher: SimpleNamespace,
+    ) -> None:
         """Webhook accepts request with valid secret token."""
-        mock_bot = MagicMock()
-        mock_dispatcher = MagicMock()
-        mock_dispatcher.feed_update = AsyncMock()
-
         with (
             patch("src.bot.webhook.settings") as mock_settings,
             patch("src.bot.webhook.get_bot", return_value=mock_bot),
@@ -75,7 +88,7 @@ class TestTelegramWebhook:
         ):
             mock_settings.telegram.webhook_secret.get_secret_value.return_value = "correct-secret"
 
-            response = await client.post(
+            response = client.post(
                 "/telegram/webhook",
                 json=SAMPLE_UPDATE,
                 headers={"X-Telegram-Bot-Api-Secret-Token": "correct-secret"},
@@ -84,12 +97,13 @@ class TestTelegramWebhook:
         assert response.status_code == HTTP_OK
         mock_dispatcher.feed_update.assert_called_once()
 
-    async def test_webhook_succeeds_without_secret_configured(self, client: AsyncClient) -> None:
+    def test_webhook_succeeds_without_secret_configured(
+        self,
+        client: TestClient,
+        mock_bot: object,
+        mock_dispatcher: SimpleNamespace,
+    ) -> None:
         """Webhook succeeds when no secret is configured."""
-        mock_bot = MagicMock()
-        mock_dispatcher = MagicMock()
-        mock_dispatcher.feed_update = AsyncMock()
-
         with (
             patch("src.bot.webhook.settings") as mock_settings,
             patch("src.bot.webhook.get_bot", return_value=mock_bot),
@@ -97,7 +111,7 @@ class TestTelegramWebhook:
         ):
             mock_settings.telegram.webhook_secret.get_secret_value.return_value = ""
 
-            response = await client.post(
+            response = client.post(
                 "/telegram/webhook",
                 json=SAMPLE_UPDATE,
                 # No secret header
@@ -106,12 +120,13 @@ class TestTelegramWebhook:
         assert response.status_code == HTTP_OK
         mock_dispatcher.feed_update.assert_called_once()
 
-    async def test_webhook_processes_update(self, client: AsyncClient) -> None:
+    def test_webhook_processes_update(
+        self,
+        client: TestClient,
+        mock_bot: object,
+        mock_dispatcher: SimpleNamespace,
+    ) -> None:
         """Webhook correctly processes and feeds update to dispatcher."""
-        mock_bot = MagicMock()
-        mock_dispatcher = MagicMock()
-        mock_dispatcher.feed_update = AsyncMock()
-
         with (
             patch("src.bot.webhook.settings") as mock_settings,
             patch("src.bot.webhook.get_bot", return_value=mock_bot),
@@ -119,7 +134,7 @@ class TestTelegramWebhook:
         ):
             mock_settings.telegram.webhook_secret.get_secret_value.return_value = ""
 
-            response = await client.post(
+            response = client.post(
                 "/telegram/webhook",
                 json=SAMPLE_UPDATE,
             )
@@ -0,0 +1,24 @@
+from typing import Final
+
+from aiogram.types import Message
+
+from tests.mimic.calls import CallRecorder
+
+# Stands in for a callback message that is not a `Message`, e.g. an inaccessible one
+NOT_A_MESSAGE: Final = object()
+
+
+class FakeMessage:
+    """A slotted stand-in for `aiogram.types.Message` that passes `isinstance` checks."""
+
+    __slots__ = ("answer", "delete", "edit_text", "text")
+
+    def __init__(self, text: str | None = "test") -> None:
+        self.text = text
+        self.answer = CallRecorder()
+        self.edit_text = CallRecorder()
+        self.delete = CallRecorder()
+
+    @property  # type: ignore[misc]
+    def __class__(self) -> type[Message]:  # type: ignore[override]
+        return Message
@@ -0,0 +1,31 @@
+from collections.abc import Coroutine
+from typing import Any
+
+
+async def _resolve[T](value: T) -> T:
+    return value
+
+
+class CallRecorder:
+    """A cheap stand-in for `AsyncMock` that records calls and returns an awaitable.
+
+    Assert on `called` / `call_count` directly instead of `Mock`-style helpers.
+    """
+
+    __slots__ = ("calls", "return_value")
+
+    def __init__(self, return_value: Any = None) -> None:
+        self.calls: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
+        self.return_value = return_value
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Coroutine[Any, Any, Any]:
+        self.calls.append((args, kwargs))
+        return _resolve(self.return_value)
+
+    @property
+    def called(self) -> bool:
+        return bool(self.calls)
+
+    @property
+    def call_count(self) -> int:
+        return len(self.calls)
@@ -0,0 +1,5 @@
+from datetime import UTC, datetime
+from typing import Final
+
+# One fixed instant so timestamps in test data are reproducible across runs
+FIXED_DT: Final = datetime(2024, 1, 1, tzinfo=UTC)
@@ -0,0 +1,22 @@
+from collections.abc import Callable
+from typing import Any
+
+
+class I18nRecorder:
+    """A cheap stand-in for a `MagicMock` around `I18nContext.get`.
+
+    Assert with `"key" in recorder.keys`, or `("key", {...}) in recorder.calls`
+    when the translation parameters matter.
+    """
+
+    __slots__ = ("_get", "calls", "keys")
+
+    def __init__(self, get: Callable[..., str]) -> None:
+        self._get = get
+        self.keys: set[str] = set()
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+
+    def __call__(self, key: str, **kwargs: Any) -> str:
+        self.keys.add(key)
+        self.calls.append((key, kwargs))
+        return self._get(key, **kwargs)
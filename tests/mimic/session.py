@@ -1,14 +1,25 @@
+import functools
+from collections.abc import Callable
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
-class FakeSessionMaker:
+class FakeSessionMaker[SessionT = AsyncSession]:
     """A session maker that returns the test session for transaction isolation."""
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(self, session: SessionT) -> None:
         self._session = session
 
-    async def __aenter__(self) -> AsyncSession:
+    async def __aenter__(self) -> SessionT:
         return self._session
 
     async def __aexit__(self, *args: object) -> None:
         pass
+
+
+def fake_session_maker[SessionT](session: SessionT) -> Callable[[], FakeSessionMaker[SessionT]]:
+    """Stand in for `AsyncSessionMaker`: each call opens a context yielding `session`.
+
+    Handler tests can pass a bare namespace holding only the awaited methods.
+    """
+    return functools.partial(FakeSessionMaker, session)
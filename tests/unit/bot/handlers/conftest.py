@@ -1,8 +1,12 @@
 """Fixtures for bot handler tests."""
 
+import copy
+import functools
+from collections.abc import Callable, Iterator
+from types import ModuleType, SimpleNamespace
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
-from uuid import uuid4
+from uuid import UUID
 
 import pytest
 from aiogram.fsm.context import FSMContext
@@ -11,6 +15,29 @@ from aiogram_i18n import I18nContext
 
 from src.modules.users.dto import UserReadDTO
 from src.modules.users.enums import LanguagePair, UILanguage
+from tests.mimic.calls import CallRecorder
+from tests.mimic.clock import FIXED_DT
+from tests.mimic.i18n import I18nRecorder
+from tests.mimic.session import fake_session_maker
+
+_FIXED_UUID = UUID("00000000-0000-0000-0000-000000000001")
+
+
+@functools.cache
+def _spec_template(spec: type) -> MagicMock:
+    return MagicMock(spec=spec)
+
+
+def _spec_mock(spec: type) -> MagicMock:
+    """Shallow-copy a cached `MagicMock(spec=spec)`.
+
+    `spec=` introspection of aiogram models costs milliseconds per mock. The copy
+    gets its own child and call registries, so nothing recorded leaks between tests.
+    """
+    mock = copy.copy(_spec_template(spec))
+    mock.__dict__["_mock_children"] = {}
+    mock.reset_mock()
+    return mock
 
 
 @pytest.fixture
@@ -33,7 +60,7 @@ def mock_chat() -> Chat:
 @pytest.fixture
 def mock_message(mock_user: User, mock_chat: Chat) -> MagicMock:
     """Create a mock aiogram Message."""
-    message = MagicMock(spec=Message)
+    message = _spec_mock(Message)
     message.from_user = mock_user
     message.chat = mock_chat
     message.message_id = 1
@@ -47,7 +74,7 @@ def mock_message(mock_user: User, mock_chat: Chat) -> MagicMock:
 @pytest.fixture
 def mock_callback(mock_user: User, mock_message: MagicMock) -> MagicMock:
     """Create a mock aiogram CallbackQuery."""
-    callback = MagicMock(spec=CallbackQuery)
+    callback = _spec_mock(CallbackQuery)
     callback.id = "callback_123"
     callback.from_user = mock_user
     callback.data = "test:callback"
@@ -59,7 +86,7 @@ def mock_callback(mock_user: User, mock_message: MagicMock) -> MagicMock:
 @pytest.fixture
 def mock_state() -> MagicMock:
     """Create a mock FSMContext."""
-    state = MagicMock(spec=FSMContext)
+    state = _spec_mock(FSMContext)
     state.get_data = AsyncMock(return_value={})
     state.update_data = AsyncMock()
     state.set_state = AsyncMock()
@@ -68,9 +95,12 @@ def mock_state() -> MagicMock:
     return state
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_i18n() -> MagicMock:
-    """Create a mock I18nContext."""
+    """Create a mock I18nContext shared by the whole session.
+
+    Tests must not assign to it directly; use `monkeypatch` or `record_i18n`.
+    """
     i18n = MagicMock(spec=I18nContext)
 
     def get_translation(key: str, **kwargs: Any) -> str:
@@ -80,17 +110,31 @@ def mock_i18n() -> MagicMock:
             return f"[{key}: {params}]"
         return f"[{key}]"
 
-    i18n.get = MagicMock(side_effect=get_translation)
+    # Plain function: most tests never assert on translation calls, see `record_i18n`
+    i18n.get = get_translation
     return i18n
 
 
+@pytest.fixture(autouse=True)
+def _reset_mock_i18n(mock_i18n: MagicMock) -> Iterator[None]:
+    """Drop call records on the shared `mock_i18n` so they do not pile up across the session."""
+    yield
+    mock_i18n.reset_mock()
+
+
 @pytest.fixture
-def db_user() -> UserReadDTO:
-    """Create a mock database user."""
-    from datetime import UTC, datetime
+def record_i18n(mock_i18n: MagicMock, monkeypatch: pytest.MonkeyPatch) -> I18nRecorder:
+    """Record `mock_i18n.get` calls for tests asserting on translation keys."""
+    recorder = I18nRecorder(mock_i18n.get)
+    monkeypatch.setattr(mock_i18n, "get", recorder)
+    return recorder
+
 
+@pytest.fixture(scope="session")
+def db_user() -> UserReadDTO:
+    """Create a mock database user, validated once per session; handlers only read it."""
     return UserReadDTO(
-        id=uuid4(),
+        id=_FIXED_UUID,
         telegram_id=123456789,
         username="testuser",
         first_name="Test",
@@ -99,6 +143,46 @@ def db_user() -> UserReadDTO:
         timezone="UTC",
         notifications_enabled=True,
         notification_times=["09:00", "21:00"],
-        created_at=datetime.now(tz=UTC),
-        updated_at=datetime.now(tz=UTC),
+        created_at=FIXED_DT,
+        updated_at=FIXED_DT,
     )
+
+
+def _service_mock(service_cls: type) -> MagicMock:
+    """Mock a service class whose instance is `spec_set` to the real service.
+
+    Coroutine methods come back as `AsyncMock`s, so tests only set `return_value`.
+    """
+    return MagicMock(spec_set=service_cls, return_value=MagicMock(spec_set=service_cls))
+
+
+@pytest.fixture
+def patch_handler_env(monkeypatch: pytest.MonkeyPatch) -> Callable[..., SimpleNamespace]:
+    """Patch a handler module's `AsyncSessionMaker` and service classes.
+
+    Returns a namespace with the `session` yielded by the session maker and the
+    `service` instance the handler constructs. Extra services are passed as
+    `attr="ClassName"` and exposed under `attr`. With `safe_edit=True` the
+    module's `safe_edit_or_send` is replaced by an `AsyncMock` exposed as `safe_edit`.
+    """
+
+    def _patch(
+        module: ModuleType,
+        service: str,
+        *,
+        safe_edit: bool = False,
+        **extra_services: str,
+    ) -> SimpleNamespace:
+        session = SimpleNamespace(commit=CallRecorder())
+        monkeypatch.setattr(module, "AsyncSessionMaker", fake_session_maker(session))
+        mocks = SimpleNamespace(session=session)
+        if safe_edit:
+            mocks.safe_edit = AsyncMock()
+            monkeypatch.setattr(module, "safe_edit_or_send", mocks.safe_edit)
+        for attr, name in {"service": service, **extra_services}.items():
+            service_cls = _service_mock(getattr(module, name))
+            monkeypatch.setattr(module, name, service_cls)
+            setattr(mocks, attr, service_cls.return_value)
+        return mocks
+
+    return _patch
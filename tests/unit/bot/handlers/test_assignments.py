@@ -1,12 +1,13 @@
 """Tests for assignment handlers."""
 
-from datetime import UTC, datetime
-from unittest.mock import AsyncMock, MagicMock, patch
-from uuid import UUID, uuid4
+from collections.abc import Awaitable, Callable
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from uuid import UUID
 
-from aiogram.fsm.context import FSMContext
-from aiogram.types import CallbackQuery, Message
+import pytest
 
+from src.bot.handlers import assignments as assignments_handlers
 from src.bot.handlers.assignments import (
     AssignmentStates,
     on_ai_method,
@@ -25,6 +26,7 @@ from src.bot.handlers.assignments import (
     on_view_result,
     on_view_submission,
 )
+from src.core.exceptions import NotFoundError, ValidationError
 from src.modules.teaching.dto import (
     AssignmentReadDTO,
     AssignmentSubmissionReadDTO,
@@ -32,57 +34,19 @@ from src.modules.teaching.dto import (
 )
 from src.modules.teaching.enums import AssignmentStatus, AssignmentType
 from src.modules.users.dto import UserReadDTO
-from src.modules.users.enums import LanguagePair, UILanguage
-
-
-def create_mock_i18n() -> MagicMock:
-    i18n = MagicMock()
-    i18n.get = MagicMock(side_effect=lambda key, **_: f"[{key}]")
-    return i18n
-
-
-def create_mock_db_user() -> UserReadDTO:
-    return UserReadDTO(
-        id=uuid4(),
-        telegram_id=12345,
-        username="testuser",
-        first_name="Test",
-        ui_language=UILanguage.EN,
-        language_pair=LanguagePair.EN_RU,
-        timezone="UTC",
-        notifications_enabled=True,
-        notification_times=["09:00", "21:00"],
-        created_at=datetime.now(UTC),
-        updated_at=datetime.now(UTC),
-    )
-
-
-def create_mock_callback(data: str) -> MagicMock:
-    callback = MagicMock(spec=CallbackQuery)
-    callback.data = data
-    callback.answer = AsyncMock()
-    callback.message = MagicMock(spec=Message)
-    callback.message.edit_text = AsyncMock()
-    callback.message.delete = AsyncMock()
-    callback.message.answer = AsyncMock()
-    return callback
+from tests.mimic.aiogram import FakeMessage
+from tests.mimic.clock import FIXED_DT
 
+ASSIGNMENT_ID = UUID("00000000-0000-4000-8000-000000000001")
+TEACHER_ID = UUID("00000000-0000-4000-8000-000000000002")
+STUDENT_ID = UUID("00000000-0000-4000-8000-000000000003")
+SUBMISSION_ID = UUID("00000000-0000-4000-8000-000000000004")
 
-def create_mock_message(text: str = "test") -> MagicMock:
-    message = MagicMock(spec=Message)
-    message.text = text
-    message.answer = AsyncMock()
-    message.edit_text = AsyncMock()
-    return message
 
-
-def create_mock_state() -> MagicMock:
-    state = MagicMock(spec=FSMContext)
-    state.get_data = AsyncMock(return_value={})
-    state.update_data = AsyncMock()
-    state.set_state = AsyncMock()
-    state.clear = AsyncMock()
-    return state
+@pytest.fixture(autouse=True)
+def handler_mocks(patch_handler_env: Callable[..., SimpleNamespace]) -> SimpleNamespace:
+    """Patch the session maker, service and `safe_edit_or_send` for every test."""
+    return patch_handler_env(assignments_handlers, "AssignmentService", safe_edit=True)
 
 
 def create_mock_assignment(
@@ -91,10 +55,10 @@ def create_mock_assignment(
     status: AssignmentStatus = AssignmentStatus.PUBLISHED,
     assignment_type: AssignmentType = AssignmentType.TEXT,
 ) -> AssignmentReadDTO:
-    return AssignmentReadDTO(
-        id=uuid4(),
-        teacher_id=teacher_id or uuid4(),
-        student_id=student_id or uuid4(),
+    return AssignmentReadDTO.model_construct(
+        id=ASSIGNMENT_ID,
+        teacher_id=teacher_id or TEACHER_ID,
+        student_id=student_id or STUDENT_ID,
         title="Test Assignment",
         description="Description",
         assignment_type=assignment_type,
@@ -102,1021 +66,731 @@ def create_mock_assignment(
         status=status,
         ai_generated=False,
         due_date=None,
-        created_at=datetime.now(UTC),
+        created_at=FIXED_DT,
     )
 
 
 def create_mock_submission() -> AssignmentSubmissionReadDTO:
-    return AssignmentSubmissionReadDTO(
-        id=uuid4(),
-        assignment_id=uuid4(),
-        student_id=uuid4(),
+    return AssignmentSubmissionReadDTO.model_construct(
+        id=SUBMISSION_ID,
+        assignment_id=ASSIGNMENT_ID,
+        student_id=STUDENT_ID,
         content={"answers": [{"question_id": "q1", "answer": "4"}]},
         ai_feedback="Good job!",
         ai_score=85,
         teacher_feedback=None,
         grade=None,
-        submitted_at=datetime.now(UTC),
+        submitted_at=FIXED_DT,
         graded_at=None,
     )
 
 
 class TestOnAssignmentList:
-    async def test_shows_no_assignments_message(self) -> None:
-        callback = create_mock_callback("assign:list")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-
-        with patch("src.bot.handlers.assignments.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-            with patch("src.bot.handlers.assignments.AssignmentService") as mock_service_cls:
-                mock_service = mock_service_cls.return_value
-                mock_service.get_teacher_assignments = AsyncMock(return_value=[])
-
-                with patch("src.bot.handlers.assignments.safe_edit_or_send", new_callable=AsyncMock):
-                    await on_assignment_list(callback, i18n, db_user)
-
-                    callback.answer.assert_called_once()
-
-    async def test_shows_assignments_list(self) -> None:
-        callback = create_mock_callback("assign:list")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-
-        assignment = AssignmentSummaryDTO(
-            id=uuid4(),
+    async def test_shows_no_assignments_message(
+        self,
+        mock_callback: MagicMock,
+        mock_i18n: MagicMock,
+        db_user: UserReadDTO,
+        handler_mocks: SimpleNamespace,
+    ) -> None:
+        mock_callback.data = "assign:list"
+
+        handler_mocks.service.get_teacher_assignments.return_value = []
+
+        await on_assignment_list(mock_callback, mock_i18n, db_user)
+
+        mock_callback.answer.assert_called_once()
+
+    async def test_shows_assignments_list(
+        self,
+        mock_callback: MagicMock,
+        mock_i18n: MagicMock,
+        db_user: UserReadDTO,
+        handler_mocks: SimpleNamespace,
+    ) -> None:
+        mock_callback.data = "assign:list"
+
+        assignment = AssignmentSummaryDTO.model_construct(
+            id=ASSIGNMENT_ID,
             title="Test",
             assignment_type=AssignmentType.TEXT,
             status=AssignmentStatus.PUBLISHED,
             due_date=None,
-            created_at=datetime.now(UTC),
+            created_at=FIXED_DT,
         )
 
-        with patch("src.bot.handlers.assignments.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-            with patch("src.bot.handlers.assignments.AssignmentService") as mock_service_cls:
-                mock_service = mock_service_cls.return_value
-                mock_service.get_teacher_assignments = AsyncMock(return_value=[assignment])
+        handler_mocks.service.get_teacher_assignments.return_value = [assignment]
 
-                with patch("src.bot.handlers.assignments.safe_edit_or_send", new_callable=AsyncMock):
-                    await on_assignment_list(callback, i18n, db_user)
+        await on_assignment_list(mock_callback, mock_i18n, db_user)
 
-                    callback.answer.assert_called_once()
+        mock_callback.answer.assert_called_once()
 
 
 class TestOnNewAssignment:
-    async def test_shows_type_selection(self) -> None:
-        student_id = uuid4()
-        callback = create_mock_callback(f"assign:new:{student_id}")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
+    async def test_shows_type_selection(
+        self,
+        mock_callback: MagicMock,
+        mock_i18n: MagicMock,
+        db_user: UserReadDTO,
+    ) -> None:
+        mock_callback.data = f"assign:new:{STUDENT_ID}"
 
-        with patch("src.bot.handlers.assignments.safe_edit_or_send", new_callable=AsyncMock):
-            await on_new_assignment(callback, i18n, db_user)
+        await on_new_assignment(mock_callback, mock_i18n, db_user)
 
-            callback.answer.assert_called_once()
+        mock_callback.answer.assert_called_once()
 
-    async def test_invalid_student_id(self) -> None:
-        callback = create_mock_callback("assign:new:invalid")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
+    async def test_invalid_student_id(
+        self,
+        mock_callback: MagicMock,
+        mock_i18n: MagicMock,
+        db_user: UserReadDTO,
+    ) -> None:
+        mock_callback.data = "assign:new:invalid"
 
-        await on_new_assignment(callback, i18n, db_user)
+        await on_new_assignment(mock_callback, mock_i18n, db_user)
 
-        callback.answer.assert_called_once()
+        mock_callback.answer.assert_called_once()
 
 
 class TestOnSelectType:
-    async def test_shows_method_selection(self) -> None:
-        student_id = uuid4()
-        callback = create_mock_callback(f"assign:type:text:{student_id}")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
+    async def test_shows_method_selection(
+        self,
+        mock_callback: MagicMock,
+        mock_i18n: MagicMock,
+        db_user: UserReadDTO,
+    ) -> None:
+        mock_callback.data = f"assign:type:text:{STUDENT_ID}"
 
-        with patch("src.bot.handlers.assignments.safe_edit_or_send", new_callable=AsyncMock):
-            await on_select_type(callback, i18n, db_user)
+        await on_select_type(mock_callback, mock_i18n, db_user)
 
-            callback.answer.assert_called_once()
+        mock_callback.answer.assert_called_once()
 
 
 class TestOnAIMethod:
-    async def test_shows_difficulty_selection(self) -> None:
-        student_id = uuid4()
-        callback = create_mock_callback(f"assign:ai:text:{student_id}")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
+    async def test_shows_difficulty_selection(
+        self,
+        mock_callback: MagicMock,
+        mock_i18n: MagicMock,
+        db_user: UserReadDTO,
+    ) -> None:
+        mock_callback.data = f"assign:ai:text:{STUDENT_ID}"
 
-        with patch("src.bot.handlers.assignments.safe_edit_or_send", new_callable=AsyncMock):
-            await on_ai_method(callback, i18n, db_user)
+        await on_ai_method(mock_callback, mock_i18n, db_user)
 
-            callback.answer.assert_called_once()
+        mock_callback.answer.assert_called_once()
 
 
 class TestOnSelectDifficulty:
-    async def test_enters_topic_state(self) -> None:
-        student_id = uuid4()
-        callback = create_mock_callback(f"assign:diff:easy:text:{student_id}")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-        state = create_mock_state()
+    async def test_enters_topic_state(
+        self,
+        mock_callback: MagicMock,
+        mock_i18n: MagicMock,
+        db_user: UserReadDTO,
+        mock_state: MagicMock,
+    ) -> None:
+        mock_callback.data = f"assign:diff:easy:text:{STUDENT_ID}"
 
-        with patch("src.bot.handlers.assignments.safe_edit_or_send", new_callable=AsyncMock):
-            await on_select_difficulty(callback, i18n, db_user, state)
+        await on_select_difficulty(mock_callback, mock_i18n, db_user, mock_state)
 
-            state.set_state.assert_called_once_with(AssignmentStates.entering_topic)
-            state.update_data.assert_called_once()
-            callback.answer.assert_called_once()
+        mock_state.set_state.assert_called_once_with(AssignmentStates.entering_topic)
+        mock_state.update_data.assert_called_once()
+        mock_callback.answer.assert_called_once()
 
 
 class TestOnTopicInput:
-    async def test_generates_assignment(self) -> None:
-        message = create_mock_message("fruits vocabulary")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-        state = create_mock_state()
-        state.get_data = AsyncMock(
-            return_value={
-                "student_id": str(uuid4()),
-                "assignment_type": "text",
-                "difficulty": "easy",
-            }
-        )
-
-        generating_msg = AsyncMock()
-        generating_msg.edit_text = AsyncMock()
-        message.answer = AsyncMock(return_value=generating_msg)
+    async def test_generates_assignment(
+        self,
+        mock_message: MagicMock,
+        mock_i18n: MagicMock,
+        db_user: UserReadDTO,
+        handler_mocks: SimpleNamespace,
+        mock_state: MagicMock,
+    ) -> None:
+        mock_message.text = "fruits vocabulary"
+        mock_state.get_data.return_value = {
+            "student_id": str(STUDENT_ID),
+            "assignment_type": "text",
+            "difficulty": "easy",
+        }
+
+        generating_msg = FakeMessage()
+        mock_message.answer.return_value = generating_msg
 
         mock_assignment = create_mock_assignment()
 
-        with patch("src.bot.handlers.assignments.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session.commit = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-            with patch("src.bot.handlers.assignments.AssignmentService") as mock_service_cls:
-                mock_service = mock_service_cls.return_value
-                mock_service.generate_ai_assignment = AsyncMock(return_value=mock_assignment)
+        handler_mocks.service.generate_ai_assignment.return_value = mock_assignment
 
-                await on_topic_input(message, i18n, db_user, state)
+        await on_topic_input(mock_message, mock_i18n, db_user, mock_state)
 
-                state.clear.assert_called_once()
-                mock_service.generate_ai_assignment.assert_called_once()
+        mock_state.clear.assert_called_once()
+        handler_mocks.service.generate_ai_assignment.assert_called_once()
 
-    async def test_empty_topic_error(self) -> None:
-        message = create_mock_message("")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-        state = create_mock_state()
-        state.get_data = AsyncMock(return_value={})
+    async def test_empty_topic_error(
+        self,
+        mock_message: MagicMock,
+        mock_i18n: MagicMock,
+        db_user: UserReadDTO,
+        mock_state: MagicMock,
+    ) -> None:
+        mock_message.text = ""
 
-        await on_topic_input(message, i18n, db_user, state)
+        await on_topic_input(mock_message, mock_i18n, db_user, mock_state)
 
-        message.answer.assert_called()
+        mock_message.answer.assert_called()
 
 
 class TestOnViewAssignment:
-    async def test_shows_assignment_details(self) -> None:
+    async def test_shows_assignment_details(
+        self,
+        mock_callback: MagicMock,
+        mock_i18n: MagicMock,
+        db_user: UserReadDTO,
+        handler_mocks: SimpleNamespace,
+    ) -> None:
         assignment = create_mock_assignment()
-        callback = create_mock_callback(f"assign:view:{assignment.id}")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
+        mock_callback.data = f"assign:view:{assignment.id}"
 
-        with patch("src.bot.handlers.assignments.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
+        handler_mocks.service.get_assignment.return_value = assignment
+        handler_mocks.service.get_submission.return_value = None
 
-            with patch("src.bot.handlers.assignments.AssignmentService") as mock_service_cls:
-                mock_service = mock_service_cls.return_value
-                mock_service.get_assignment = AsyncMock(return_value=assignment)
-                mock_service.get_submission = AsyncMock(return_value=None)
+        await on_view_assignment(mock_callback, mock_i18n, db_user)
 
-                with patch("src.bot.handlers.assignments.safe_edit_or_send", new_callable=AsyncMock):
-                    await on_view_assignment(callback, i18n, db_user)
+        mock_callback.answer.assert_called_once()
 
-                    callback.answer.assert_called_once()
+    async def test_not_found(
+        self,
+        mock_callback: MagicMock,
+        mock_i18n: MagicMock,
+        db_user: UserReadDTO,
+        handler_mocks: SimpleNamespace,
+    ) -> None:
+        mock_callback.data = f"assign:view:{ASSIGNMENT_ID}"
 
-    async def test_not_found(self) -> None:
-        callback = create_mock_callback(f"assign:view:{uuid4()}")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
+        handler_mocks.service.get_assignment.return_value = None
 
-        with patch("src.bot.handlers.assignments.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
+        await on_view_assignment(mock_callback, mock_i18n, db_user)
 
-            with patch("src.bot.handlers.assignments.AssignmentService") as mock_service_cls:
-                mock_service = mock_service_cls.return_value
-                mock_service.get_assignment = AsyncMock(return_value=None)
-
-                await on_view_assignment(callback, i18n, db_user)
-
-                callback.answer.assert_called()
+        mock_callback.answer.assert_called()
 
 
 class TestOnPendingAssignments:
-    async def test_shows_pending_list(self) -> None:
-        callback = create_mock_callback("assign:pending")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
+    async def test_shows_pending_list(
+        self,
+        mock_callback: MagicMock,
+        mock_i18n: MagicMock,
+        db_user: UserReadDTO,
+        handler_mocks: SimpleNamespace,
+    ) -> None:
+        mock_callback.data = "assign:pending"
 
-        with patch("src.bot.handlers.assignments.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
+        handler_mocks.service.get_student_pending_assignments.return_value = []
 
-            with patch("src.bot.handlers.assignments.AssignmentService") as mock_service_cls:
-                mock_service = mock_service_cls.return_value
-                mock_service.get_student_pending_assignments = AsyncMock(return_value=[])
+        await on_pending_assignments(mock_callback, mock_i18n, db_user)
 
-                with patch("src.bot.handlers.assignments.safe_edit_or_send", new_callable=AsyncMock):
-                    await on_pending_assignments(callback, i18n, db_user)
-
-                    callback.answer.assert_called_once()
+        mock_callback.answer.assert_called_once()
 
 
 class TestOnStartAssignment:
-    async def test_starts_text_assignment(self) -> None:
+    async def test_starts_text_assignment(
+        self,
+        mock_callback: MagicMock,
+        mock_i18n: MagicMock,
+        db_user: UserReadDTO,
+        handler_mocks: SimpleNamespace,
+        mock_state: MagicMock,
+    ) -> None:
         assignment = create_mock_assignment(assignment_type=AssignmentType.TEXT)
-        callback = create_mock_callback(f"assign:start:{assignment.id}")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-        state = create_mock_state()
-
-        with patch("src.bot.handlers.assignments.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
+        mock_callback.data = f"assign:start:{assignment.id}"
 
-            with patch("src.bot.handlers.assignments.AssignmentService") as mock_service_cls:
-                mock_service = mock_service_cls.return_value
-                mock_service.get_assignment = AsyncMock(return_value=assignment)
+        handler_mocks.service.get_assignment.return_value = assignment
 
-                with patch("src.bot.handlers.assignments.safe_edit_or_send", new_callable=AsyncMock):
-                    await on_start_assignment(callback, i18n, db_user, state)
+        await on_start_assignment(mock_callback, mock_i18n, db_user, mock_state)
 
-                    state.set_state.assert_called_once_with(AssignmentStates.entering_answer)
-                    callback.answer.assert_called_once()
+        mock_state.set_state.assert_called_once_with(AssignmentStates.entering_answer)
+        mock_callback.answer.assert_called_once()
 
-    async def test_starts_voice_assignment(self) -> None:
+    async def test_starts_voice_assignment(
+        self,
+        mock_callback: MagicMock,
+        mock_i18n: MagicMock,
+        db_user: UserReadDTO,
+        handler_mocks: SimpleNamespace,
+        mock_state: MagicMock,
+    ) -> None:
         assignment = create_mock_assignment(assignment_type=AssignmentType.VOICE)
         assignment.content = {"words": [{"id": "w1", "text": "hello"}]}
-        callback = create_mock_callback(f"assign:start:{assignment.id}")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-        state = create_mock_state()
+        mock_callback.data = f"assign:start:{assignment.id}"
 
-        with patch("src.bot.handlers.assignments.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
+        handler_mocks.service.get_assignment.return_value = assignment
 
-            with patch("src.bot.handlers.assignments.AssignmentService") as mock_service_cls:
-                mock_service = mock_service_cls.return_value
-                mock_service.get_assignment = AsyncMock(return_value=assignment)
+        await on_start_assignment(mock_callback, mock_i18n, db_user, mock_state)
 
-                with patch("src.bot.handlers.assignments.safe_edit_or_send", new_callable=AsyncMock):
-                    await on_start_assignment(callback, i18n, db_user, state)
-
-                    state.set_state.assert_called_once()
+        mock_state.set_state.assert_called_once()
 
 
 class TestOnAnswerInput:
-    async def test_submits_answer(self) -> None:
-        message = create_mock_message("answer1\nanswer2")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-        state = create_mock_state()
-        state.get_data = AsyncMock(return_value={"assignment_id": str(uuid4())})
+    async def test_submits_answer(
+        self,
+        mock_message: MagicMock,
+        mock_i18n: MagicMock,
+        db_user: UserReadDTO,
+        handler_mocks: SimpleNamespace,
+        mock_state: MagicMock,
+    ) -> None:
+        mock_message.text = "answer1\nanswer2"
+        mock_state.get_data.return_value = {"assignment_id": str(ASSIGNMENT_ID)}
 
         submission = create_mock_submission()
 
-        with patch("src.bot.handlers.assignments.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session.commit = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-            with patch("src.bot.handlers.assignments.AssignmentService") as mock_service_cls:
-                mock_service = mock_service_cls.return_value
-                mock_service.submit_assignment = AsyncMock(return_value=submission)
+        handler_mocks.service.submit_assignment.return_value = submission
 
-                await on_answer_input(message, i18n, db_user, state)
+        await on_answer_input(mock_message, mock_i18n, db_user, mock_state)
 
-                state.clear.assert_called_once()
-                mock_service.submit_assignment.assert_called_once()
+        mock_state.clear.assert_called_once()
+        handler_mocks.service.submit_assignment.assert_called_once()
 
-    async def test_empty_answer_error(self) -> None:
-        message = create_mock_message("")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-        state = create_mock_state()
-        state.get_data = AsyncMock(return_value={})
+    async def test_empty_answer_error(
+        self,
+        mock_message: MagicMock,
+        mock_i18n: MagicMock,
+        db_user: UserReadDTO,
+        mock_state: MagicMock,
+    ) -> None:
+        mock_message.text = ""
 
-        await on_answer_input(message, i18n, db_user, state)
+        await on_answer_input(mock_message, mock_i18n, db_user, mock_state)
 
-        message.answer.assert_called()
+        mock_message.answer.assert_called()
 
 
 class TestOnViewSubmission:
-    async def test_shows_submission(self) -> None:
+    async def test_shows_submission(
+        self,
+        mock_callback: MagicMock,
+        mock_i18n: MagicMock,
+        db_user: UserReadDTO,
+        handler_mocks: SimpleNamespace,
+    ) -> None:
         submission = create_mock_submission()
-        callback = create_mock_callback(f"assign:submission:{uuid4()}")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-
-        with patch("src.bot.handlers.assignments.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
+        mock_callback.data = f"assign:submission:{ASSIGNMENT_ID}"
 
-            with patch("src.bot.handlers.assignments.AssignmentService") as mock_service_cls:
-                mock_service = mock_service_cls.return_value
-                mock_service.get_submission = AsyncMock(return_value=submission)
+        handler_mocks.service.get_submission.return_value = submission
 
-                with patch("src.bot.handlers.assignments.safe_edit_or_send", new_callable=AsyncMock):
-                    await on_view_submission(callback, i18n, db_user)
+        await on_view_submission(mock_callback, mock_i18n, db_user)
 
-                    callback.answer.assert_called_once()
+        mock_callback.answer.assert_called_once()
 
 
 class TestOnGradeAssignment:
-    async def test_shows_grade_keyboard(self) -> None:
-        submission_id = uuid4()
-        callback = create_mock_callback(f"assign:grade:{submission_id}")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
+    async def test_shows_grade_keyboard(
+        self,
+        mock_callback: MagicMock,
+        mock_i18n: MagicMock,
+        db_user: UserReadDTO,
+    ) -> None:
+        mock_callback.data = f"assign:grade:{SUBMISSION_ID}"
 
-        with patch("src.bot.handlers.assignments.safe_edit_or_send", new_callable=AsyncMock):
-            await on_grade_assignment(callback, i18n, db_user)
+        await on_grade_assignment(mock_callback, mock_i18n, db_user)
 
-            callback.answer.assert_called_once()
+        mock_callback.answer.assert_called_once()
 
 
 class TestOnRateAssignment:
-    async def test_grades_assignment(self) -> None:
-        submission_id = uuid4()
-        callback = create_mock_callback(f"assign:rate:5:{submission_id}")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-
-        with patch("src.bot.handlers.assignments.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session.commit = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-            with patch("src.bot.handlers.assignments.AssignmentService") as mock_service_cls:
-                mock_service = mock_service_cls.return_value
-                mock_service.grade_assignment = AsyncMock()
+    async def test_grades_assignment(
+        self,
+        mock_callback: MagicMock,
+        mock_i18n: MagicMock,
+        db_user: UserReadDTO,
+        handler_mocks: SimpleNamespace,
+    ) -> None:
+        mock_callback.data = f"assign:rate:5:{SUBMISSION_ID}"
 
-                with patch("src.bot.handlers.assignments.safe_edit_or_send", new_callable=AsyncMock):
-                    await on_rate_assignment(callback, i18n, db_user)
+        await on_rate_assignment(mock_callback, mock_i18n, db_user)
 
-                    mock_service.grade_assignment.assert_called_once()
-                    callback.answer.assert_called()
+        handler_mocks.service.grade_assignment.assert_called_once()
+        mock_callback.answer.assert_called()
 
-    async def test_invalid_grade(self) -> None:
-        submission_id = uuid4()
-        callback = create_mock_callback(f"assign:rate:10:{submission_id}")  # Invalid grade
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
+    async def test_invalid_grade(
+        self,
+        mock_callback: MagicMock,
+        mock_i18n: MagicMock,
+        db_user: UserReadDTO,
+    ) -> None:
+        mock_callback.data = f"assign:rate:10:{SUBMISSION_ID}"  # Invalid grade
 
-        await on_rate_assignment(callback, i18n, db_user)
+        await on_rate_assignment(mock_callback, mock_i18n, db_user)
 
-        callback.answer.assert_called()
+        mock_callback.answer.assert_called()
 
 
 class TestOnViewResult:
-    async def test_shows_result(self) -> None:
+    async def test_shows_result(
+        self,
+        mock_callback: MagicMock,
+        mock_i18n: MagicMock,
+        db_user: UserReadDTO,
+        handler_mocks: SimpleNamespace,
+    ) -> None:
         submission = create_mock_submission()
         submission.grade = 5
-        callback = create_mock_callback(f"assign:result:{uuid4()}")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
+        mock_callback.data = f"assign:result:{ASSIGNMENT_ID}"
 
-        with patch("src.bot.handlers.assignments.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
+        handler_mocks.service.get_submission.return_value = submission
 
-            with patch("src.bot.handlers.assignments.AssignmentService") as mock_service_cls:
-                mock_service = mock_service_cls.return_value
-                mock_service.get_submission = AsyncMock(return_value=submission)
+        await on_view_result(mock_callback, mock_i18n, db_user)
 
-                with patch("src.bot.handlers.assignments.safe_edit_or_send", new_callable=AsyncMock):
-                    await on_view_result(callback, i18n, db_user)
-
-                    callback.answer.assert_called_once()
+        mock_callback.answer.assert_called_once()
 
 
 class TestOnAssignmentPage:
-    async def test_handles_pagination(self) -> None:
-        callback = create_mock_callback("assign:page:1")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-
-        with patch("src.bot.handlers.assignments.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-            with patch("src.bot.handlers.assignments.AssignmentService") as mock_service_cls:
-                mock_service = mock_service_cls.return_value
-                mock_service.get_teacher_assignments = AsyncMock(return_value=[])
-                mock_service.get_student_assignments = AsyncMock(return_value=[])
-
-                with patch("src.bot.handlers.assignments.safe_edit_or_send", new_callable=AsyncMock):
-                    await on_assignment_page(callback, i18n, db_user)
-
-                    callback.answer.assert_called_once()
-
-    async def test_pagination_with_teacher_assignments(self) -> None:
-        callback = create_mock_callback("assign:page:0")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-
-        assignment = AssignmentSummaryDTO(
-            id=uuid4(),
+    async def test_handles_pagination(
+        self,
+        mock_callback: MagicMock,
+        mock_i18n: MagicMock,
+        db_user: UserReadDTO,
+        handler_mocks: SimpleNamespace,
+    ) -> None:
+        mock_callback.data = "assign:page:1"
+
+        handler_mocks.service.get_teacher_assignments.return_value = []
+        handler_mocks.service.get_student_assignments.return_value = []
+
+        await on_assignment_page(mock_callback, mock_i18n, db_user)
+
+        mock_callback.answer.assert_called_once()
+
+    async def test_pagination_with_teacher_assignments(
+        self,
+        mock_callback: MagicMock,
+        mock_i18n: MagicMock,
+        db_user: UserReadDTO,
+        handler_mocks: SimpleNamespace,
+    ) -> None:
+        mock_callback.data = "assign:page:0"
+
+        assignment = AssignmentSummaryDTO.model_construct(
+            id=ASSIGNMENT_ID,
             title="Test",
             assignment_type=AssignmentType.TEXT,
             status=AssignmentStatus.PUBLISHED,
             due_date=None,
-            created_at=datetime.now(UTC),
+            created_at=FIXED_DT,
         )
 
-        with patch("src.bot.handlers.assignments.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-            with patch("src.bot.handlers.assignments.AssignmentService") as mock_service_cls:
-                mock_service = mock_service_cls.return_value
-                mock_service.get_teacher_assignments = AsyncMock(return_value=[assignment])
+        handler_mocks.service.get_teacher_assignments.return_value = [assignment]
 
-                with patch("src.bot.handlers.assignments.safe_edit_or_send", new_callable=AsyncMock):
-                    await on_assignment_page(callback, i18n, db_user)
+        await on_assignment_page(mock_callback, mock_i18n, db_user)
 
-                    callback.answer.assert_called_once()
+        mock_callback.answer.assert_called_once()
 
-    async def test_no_message_returns_early(self) -> None:
-        callback = create_mock_callback("assign:page:0")
-        callback.message = None
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
+    async def test_no_message_returns_early(
+        self,
+        mock_callback: MagicMock,
+        mock_i18n: MagicMock,
+        db_user: UserReadDTO,
+    ) -> None:
+        mock_callback.data = "assign:page:0"
+        mock_callback.message = None
 
-        await on_assignment_page(callback, i18n, db_user)
+        await on_assignment_page(mock_callback, mock_i18n, db_user)
 
 
 class TestNullMessageHandling:
-    async def test_assignment_list_no_message(self) -> None:
-        callback = create_mock_callback("assign:list")
-        callback.message = None
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-
-        await on_assignment_list(callback, i18n, db_user)
-
-    async def test_new_assignment_no_message(self) -> None:
-        callback = create_mock_callback(f"assign:new:{uuid4()}")
-        callback.message = None
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-
-        await on_new_assignment(callback, i18n, db_user)
-
-    async def test_select_type_no_message(self) -> None:
-        callback = create_mock_callback(f"assign:type:text:{uuid4()}")
-        callback.message = None
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-
-        await on_select_type(callback, i18n, db_user)
-
-    async def test_ai_method_no_message(self) -> None:
-        callback = create_mock_callback(f"assign:ai:text:{uuid4()}")
-        callback.message = None
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-
-        await on_ai_method(callback, i18n, db_user)
-
-    async def test_select_difficulty_no_message(self) -> None:
-        callback = create_mock_callback(f"assign:diff:easy:text:{uuid4()}")
-        callback.message = None
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-        state = create_mock_state()
-
-        await on_select_difficulty(callback, i18n, db_user, state)
-
-    async def test_view_assignment_no_message(self) -> None:
-        callback = create_mock_callback(f"assign:view:{uuid4()}")
-        callback.message = None
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-
-        await on_view_assignment(callback, i18n, db_user)
-
-    async def test_pending_no_message(self) -> None:
-        callback = create_mock_callback("assign:pending")
-        callback.message = None
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-
-        await on_pending_assignments(callback, i18n, db_user)
-
-    async def test_start_assignment_no_message(self) -> None:
-        callback = create_mock_callback(f"assign:start:{uuid4()}")
-        callback.message = None
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-        state = create_mock_state()
-
-        await on_start_assignment(callback, i18n, db_user, state)
-
-    async def test_view_submission_no_message(self) -> None:
-        callback = create_mock_callback(f"assign:submission:{uuid4()}")
-        callback.message = None
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-
-        await on_view_submission(callback, i18n, db_user)
-
-    async def test_grade_assignment_no_message(self) -> None:
-        callback = create_mock_callback(f"assign:grade:{uuid4()}")
-        callback.message = None
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-
-        await on_grade_assignment(callback, i18n, db_user)
-
-    async def test_rate_assignment_no_message(self) -> None:
-        callback = create_mock_callback(f"assign:rate:5:{uuid4()}")
-        callback.message = None
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-
-        await on_rate_assignment(callback, i18n, db_user)
-
-    async def test_view_result_no_message(self) -> None:
-        callback = create_mock_callback(f"assign:result:{uuid4()}")
-        callback.message = None
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-
-        await on_view_result(callback, i18n, db_user)
+    @pytest.mark.parametrize(
+        ("handler", "data", "needs_state"),
+        [
+            pytest.param(on_assignment_list, "assign:list", False, id="assignment_list"),
+            pytest.param(on_new_assignment, f"assign:new:{STUDENT_ID}", False, id="new_assignment"),
+            pytest.param(on_select_type, f"assign:type:text:{STUDENT_ID}", False, id="select_type"),
+            pytest.param(on_ai_method, f"assign:ai:text:{STUDENT_ID}", False, id="ai_method"),
+            pytest.param(on_select_difficulty, f"assign:diff:easy:text:{STUDENT_ID}", True, id="select_difficulty"),
+            pytest.param(on_view_assignment, f"assign:view:{ASSIGNMENT_ID}", False, id="view_assignment"),
+            pytest.param(on_pending_assignments, "assign:pending", False, id="pending"),
+            pytest.param(on_start_assignment, f"assign:start:{ASSIGNMENT_ID}", True, id="start_assignment"),
+            pytest.param(on_view_submission, f"assign:submission:{ASSIGNMENT_ID}", False, id="view_submission"),
+            pytest.param(on_grade_assignment, f"assign:grade:{SUBMISSION_ID}", False, id="grade_assignment"),
+            pytest.param(on_rate_assignment, f"assign:rate:5:{SUBMISSION_ID}", False, id="rate_assignment"),
+            pytest.param(on_view_result, f"assign:result:{ASSIGNMENT_ID}", False, id="view_result"),
+        ],
+    )
+    async def test_no_message(
+        self,
+        handler: Callable[..., Awaitable[None]],
+        data: str,
+        needs_state: bool,  # noqa: FBT001
+        mock_callback: MagicMock,
+        mock_i18n: MagicMock,
+        db_user: UserReadDTO,
+        mock_state: MagicMock,
+    ) -> None:
+        mock_callback.data = data
+        mock_callback.message = None
+        args = (mock_callback, mock_i18n, db_user, mock_state) if needs_state else (mock_callback, mock_i18n, db_user)
+
+        await handler(*args)
 
 
 class TestInvalidUUIDHandling:
-    async def test_select_type_invalid_uuid(self) -> None:
-        callback = create_mock_callback("assign:type:text:invalid")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-
-        await on_select_type(callback, i18n, db_user)
-
-        callback.answer.assert_called()
-
-    async def test_ai_method_invalid_uuid(self) -> None:
-        callback = create_mock_callback("assign:ai:text:invalid")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-
-        await on_ai_method(callback, i18n, db_user)
-
-        callback.answer.assert_called()
-
-    async def test_select_difficulty_invalid_uuid(self) -> None:
-        callback = create_mock_callback("assign:diff:easy:text:invalid")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-        state = create_mock_state()
-
-        await on_select_difficulty(callback, i18n, db_user, state)
-
-        callback.answer.assert_called()
-
-    async def test_view_assignment_invalid_uuid(self) -> None:
-        callback = create_mock_callback("assign:view:invalid")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-
-        await on_view_assignment(callback, i18n, db_user)
-
-        callback.answer.assert_called()
-
-    async def test_start_assignment_invalid_uuid(self) -> None:
-        callback = create_mock_callback("assign:start:invalid")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-        state = create_mock_state()
-
-        await on_start_assignment(callback, i18n, db_user, state)
-
-        callback.answer.assert_called()
-
-    async def test_view_submission_invalid_uuid(self) -> None:
-        callback = create_mock_callback("assign:submission:invalid")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-
-        await on_view_submission(callback, i18n, db_user)
-
-        callback.answer.assert_called()
-
-    async def test_grade_assignment_invalid_uuid(self) -> None:
-        callback = create_mock_callback("assign:grade:invalid")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-
-        await on_grade_assignment(callback, i18n, db_user)
-
-        callback.answer.assert_called()
-
-    async def test_view_result_invalid_uuid(self) -> None:
-        callback = create_mock_callback("assign:result:invalid")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
+    @pytest.mark.parametrize(
+        ("handler", "data", "needs_state"),
+        [
+            pytest.param(on_select_type, "assign:type:text:invalid", False, id="select_type"),
+            pytest.param(on_ai_method, "assign:ai:text:invalid", False, id="ai_method"),
+            pytest.param(on_select_difficulty, "assign:diff:easy:text:invalid", True, id="select_difficulty"),
+            pytest.param(on_view_assignment, "assign:view:invalid", False, id="view_assignment"),
+            pytest.param(on_start_assignment, "assign:start:invalid", True, id="start_assignment"),
+            pytest.param(on_view_submission, "assign:submission:invalid", False, id="view_submission"),
+            pytest.param(on_grade_assignment, "assign:grade:invalid", False, id="grade_assignment"),
+            pytest.param(on_view_result, "assign:result:invalid", False, id="view_result"),
+        ],
+    )
+    async def test_invalid_uuid(
+        self,
+        handler: Callable[..., Awaitable[None]],
+        data: str,
+        needs_state: bool,  # noqa: FBT001
+        mock_callback: MagicMock,
+        mock_i18n: MagicMock,
+        db_user: UserReadDTO,
+        mock_state: MagicMock,
+    ) -> None:
+        mock_callback.data = data
+        args = (mock_callback, mock_i18n, db_user, mock_state) if needs_state else (mock_callback, mock_i18n, db_user)
 
-        await on_view_result(callback, i18n, db_user)
+        await handler(*args)
 
-        callback.answer.assert_called()
+        mock_callback.answer.assert_called()
 
 
 class TestSubmissionNotFound:
-    async def test_view_submission_not_found(self) -> None:
-        callback = create_mock_callback(f"assign:submission:{uuid4()}")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-
-        with patch("src.bot.handlers.assignments.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-            with patch("src.bot.handlers.assignments.AssignmentService") as mock_service_cls:
-                mock_service = mock_service_cls.return_value
-                mock_service.get_submission = AsyncMock(return_value=None)
-
-                await on_view_submission(callback, i18n, db_user)
-
-                callback.answer.assert_called()
-
-    async def test_view_result_not_found(self) -> None:
-        callback = create_mock_callback(f"assign:result:{uuid4()}")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-
-        with patch("src.bot.handlers.assignments.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
+    @pytest.mark.parametrize(
+        ("handler", "prefix"),
+        [
+            pytest.param(on_view_submission, "assign:submission", id="view_submission"),
+            pytest.param(on_view_result, "assign:result", id="view_result"),
+        ],
+    )
+    async def test_not_found(
+        self,
+        handler: Callable[..., Awaitable[None]],
+        prefix: str,
+        mock_callback: MagicMock,
+        mock_i18n: MagicMock,
+        db_user: UserReadDTO,
+        handler_mocks: SimpleNamespace,
+    ) -> None:
+        mock_callback.data = f"{prefix}:{ASSIGNMENT_ID}"
 
-            with patch("src.bot.handlers.assignments.AssignmentService") as mock_service_cls:
-                mock_service = mock_service_cls.return_value
-                mock_service.get_submission = AsyncMock(return_value=None)
+        handler_mocks.service.get_submission.return_value = None
 
-                await on_view_result(callback, i18n, db_user)
+        await handler(mock_callback, mock_i18n, db_user)
 
-                callback.answer.assert_called()
+        mock_callback.answer.assert_called()
 
 
 class TestAssignmentWithDescription:
-    async def test_view_assignment_with_description(self) -> None:
-        db_user = create_mock_db_user()
-        assignment = create_mock_assignment(teacher_id=db_user.id)
-        callback = create_mock_callback(f"assign:view:{assignment.id}")
-        i18n = create_mock_i18n()
-
-        with patch("src.bot.handlers.assignments.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-            with patch("src.bot.handlers.assignments.AssignmentService") as mock_service_cls:
-                mock_service = mock_service_cls.return_value
-                mock_service.get_assignment = AsyncMock(return_value=assignment)
-                mock_service.get_submission = AsyncMock(return_value=None)
-
-                with patch("src.bot.handlers.assignments.safe_edit_or_send", new_callable=AsyncMock):
-                    await on_view_assignment(callback, i18n, db_user)
-
-                    callback.answer.assert_called_once()
-
-    async def test_view_assignment_without_description(self) -> None:
-        """Test assignment without description (line 324 branch)."""
-        db_user = create_mock_db_user()
+    @pytest.mark.parametrize(
+        "description",
+        [
+            pytest.param("Description", id="with_description"),
+            pytest.param(None, id="without_description"),
+        ],
+    )
+    async def test_view_assignment_description_variants(
+        self,
+        description: str | None,
+        mock_callback: MagicMock,
+        mock_i18n: MagicMock,
+        db_user: UserReadDTO,
+        handler_mocks: SimpleNamespace,
+    ) -> None:
         assignment = create_mock_assignment(teacher_id=db_user.id)
-        assignment.description = None  # No description
-        callback = create_mock_callback(f"assign:view:{assignment.id}")
-        i18n = create_mock_i18n()
+        assignment.description = description
+        mock_callback.data = f"assign:view:{assignment.id}"
 
-        with patch("src.bot.handlers.assignments.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
+        handler_mocks.service.get_assignment.return_value = assignment
+        handler_mocks.service.get_submission.return_value = None
 
-            with patch("src.bot.handlers.assignments.AssignmentService") as mock_service_cls:
-                mock_service = mock_service_cls.return_value
-                mock_service.get_assignment = AsyncMock(return_value=assignment)
-                mock_service.get_submission = AsyncMock(return_value=None)
+        await on_view_assignment(mock_callback, mock_i18n, db_user)
 
-                with patch("src.bot.handlers.assignments.safe_edit_or_send", new_callable=AsyncMock):
-                    await on_view_assignment(callback, i18n, db_user)
-
-                    callback.answer.assert_called_once()
+        mock_callback.answer.assert_called_once()
 
 
 class TestEmptyContent:
-    async def test_start_assignment_no_questions(self) -> None:
-        db_user = create_mock_db_user()
+    async def test_start_assignment_no_questions(
+        self,
+        mock_callback: MagicMock,
+        mock_i18n: MagicMock,
+        db_user: UserReadDTO,
+        handler_mocks: SimpleNamespace,
+        mock_state: MagicMock,
+    ) -> None:
         assignment = create_mock_assignment(student_id=db_user.id)
         assignment.content = {}  # No questions or words
-        callback = create_mock_callback(f"assign:start:{assignment.id}")
-        i18n = create_mock_i18n()
-        state = create_mock_state()
-
-        with patch("src.bot.handlers.assignments.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
+        mock_callback.data = f"assign:start:{assignment.id}"
 
-            with patch("src.bot.handlers.assignments.AssignmentService") as mock_service_cls:
-                mock_service = mock_service_cls.return_value
-                mock_service.get_assignment = AsyncMock(return_value=assignment)
+        handler_mocks.service.get_assignment.return_value = assignment
 
-                with patch("src.bot.handlers.assignments.safe_edit_or_send", new_callable=AsyncMock):
-                    await on_start_assignment(callback, i18n, db_user, state)
+        await on_start_assignment(mock_callback, mock_i18n, db_user, mock_state)
 
-                    callback.answer.assert_called_once()
+        mock_callback.answer.assert_called_once()
 
 
 class TestRateErrors:
-    async def test_rate_not_found(self) -> None:
-        from src.core.exceptions import NotFoundError
-
-        submission_id = uuid4()
-        callback = create_mock_callback(f"assign:rate:5:{submission_id}")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-
-        with patch("src.bot.handlers.assignments.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session.commit = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-            with patch("src.bot.handlers.assignments.AssignmentService") as mock_service_cls:
-                mock_service = mock_service_cls.return_value
-                mock_service.grade_assignment = AsyncMock(side_effect=NotFoundError())
-
-                await on_rate_assignment(callback, i18n, db_user)
+    @pytest.mark.parametrize("exc", [NotFoundError, ValidationError])
+    async def test_rate_error(
+        self,
+        exc: type[Exception],
+        mock_callback: MagicMock,
+        mock_i18n: MagicMock,
+        db_user: UserReadDTO,
+        handler_mocks: SimpleNamespace,
+    ) -> None:
+        mock_callback.data = f"assign:rate:5:{SUBMISSION_ID}"
 
-                callback.answer.assert_called()
+        handler_mocks.service.grade_assignment.side_effect = exc()
 
-    async def test_rate_validation_error(self) -> None:
-        from src.core.exceptions import ValidationError
+        await on_rate_assignment(mock_callback, mock_i18n, db_user)
 
-        submission_id = uuid4()
-        callback = create_mock_callback(f"assign:rate:5:{submission_id}")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-
-        with patch("src.bot.handlers.assignments.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session.commit = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-            with patch("src.bot.handlers.assignments.AssignmentService") as mock_service_cls:
-                mock_service = mock_service_cls.return_value
-                mock_service.grade_assignment = AsyncMock(side_effect=ValidationError())
-
-                await on_rate_assignment(callback, i18n, db_user)
-
-                callback.answer.assert_called()
+        mock_callback.answer.assert_called()
 
 
 class TestTopicErrors:
-    async def test_topic_missing_state_data(self) -> None:
-        message = create_mock_message("topic")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-        state = create_mock_state()
-        state.get_data = AsyncMock(return_value={})
-
-        await on_topic_input(message, i18n, db_user, state)
-
-        message.answer.assert_called()
-
-    async def test_topic_generation_error(self) -> None:
-        from src.core.exceptions import NotFoundError
-
-        message = create_mock_message("topic")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-        state = create_mock_state()
-        state.get_data = AsyncMock(
-            return_value={
-                "student_id": str(uuid4()),
-                "assignment_type": "text",
-                "difficulty": "easy",
-            }
-        )
-
-        generating_msg = AsyncMock()
-        generating_msg.edit_text = AsyncMock()
-        message.answer = AsyncMock(return_value=generating_msg)
+    async def test_topic_missing_state_data(
+        self,
+        mock_message: MagicMock,
+        mock_i18n: MagicMock,
+        db_user: UserReadDTO,
+        mock_state: MagicMock,
+    ) -> None:
+        mock_message.text = "topic"
 
-        with patch("src.bot.handlers.assignments.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session.commit = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
+        await on_topic_input(mock_message, mock_i18n, db_user, mock_state)
 
-            with patch("src.bot.handlers.assignments.AssignmentService") as mock_service_cls:
-                mock_service = mock_service_cls.return_value
-                mock_service.generate_ai_assignment = AsyncMock(side_effect=NotFoundError())
+        mock_message.answer.assert_called()
 
-                await on_topic_input(message, i18n, db_user, state)
+    async def test_topic_generation_error(
+        self,
+        mock_message: MagicMock,
+        mock_i18n: MagicMock,
+        db_user: UserReadDTO,
+        handler_mocks: SimpleNamespace,
+        mock_state: MagicMock,
+    ) -> None:
+        mock_message.text = "topic"
+        mock_state.get_data.return_value = {
+            "student_id": str(STUDENT_ID),
+            "assignment_type": "text",
+            "difficulty": "easy",
+        }
 
-                generating_msg.edit_text.assert_called()
+        generating_msg = FakeMessage()
+        mock_message.answer.return_value = generating_msg
 
+        handler_mocks.service.generate_ai_assignment.side_effect = NotFoundError()
 
-class TestAnswerErrors:
-    async def test_answer_missing_assignment_id(self) -> None:
-        message = create_mock_message("answer")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-        state = create_mock_state()
-        state.get_data = AsyncMock(return_value={})
-
-        await on_answer_input(message, i18n, db_user, state)
+        await on_topic_input(mock_message, mock_i18n, db_user, mock_state)
 
-        message.answer.assert_called()
+        assert generating_msg.edit_text.called
 
-    async def test_answer_not_found(self) -> None:
-        from src.core.exceptions import NotFoundError
 
-        message = create_mock_message("answer")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-        state = create_mock_state()
-        state.get_data = AsyncMock(return_value={"assignment_id": str(uuid4())})
-
-        with patch("src.bot.handlers.assignments.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session.commit = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-            with patch("src.bot.handlers.assignments.AssignmentService") as mock_service_cls:
-                mock_service = mock_service_cls.return_value
-                mock_service.submit_assignment = AsyncMock(side_effect=NotFoundError())
-
-                await on_answer_input(message, i18n, db_user, state)
-
-                message.answer.assert_called()
+class TestAnswerErrors:
+    async def test_answer_missing_assignment_id(
+        self,
+        mock_message: MagicMock,
+        mock_i18n: MagicMock,
+        db_user: UserReadDTO,
+        mock_state: MagicMock,
+    ) -> None:
+        mock_message.text = "answer"
 
-    async def test_answer_validation_error(self) -> None:
-        from src.core.exceptions import ValidationError
+        await on_answer_input(mock_message, mock_i18n, db_user, mock_state)
 
-        message = create_mock_message("answer")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-        state = create_mock_state()
-        state.get_data = AsyncMock(return_value={"assignment_id": str(uuid4())})
+        mock_message.answer.assert_called()
 
-        with patch("src.bot.handlers.assignments.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session.commit = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
+    @pytest.mark.parametrize("exc", [NotFoundError, ValidationError])
+    async def test_answer_error(
+        self,
+        exc: type[Exception],
+        mock_message: MagicMock,
+        mock_i18n: MagicMock,
+        db_user: UserReadDTO,
+        handler_mocks: SimpleNamespace,
+        mock_state: MagicMock,
+    ) -> None:
+        mock_message.text = "answer"
+        mock_state.get_data.return_value = {"assignment_id": str(ASSIGNMENT_ID)}
 
-            with patch("src.bot.handlers.assignments.AssignmentService") as mock_service_cls:
-                mock_service = mock_service_cls.return_value
-                mock_service.submit_assignment = AsyncMock(side_effect=ValidationError())
+        handler_mocks.service.submit_assignment.side_effect = exc()
 
-                await on_answer_input(message, i18n, db_user, state)
+        await on_answer_input(mock_message, mock_i18n, db_user, mock_state)
 
-                message.answer.assert_called()
+        mock_message.answer.assert_called()
 
 
 class TestSubmissionDetails:
-    async def test_submission_with_grade(self) -> None:
-        submission = create_mock_submission()
-        submission.grade = 4
-        submission.teacher_feedback = "Well done!"
-        callback = create_mock_callback(f"assign:submission:{uuid4()}")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-
-        with patch("src.bot.handlers.assignments.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-            with patch("src.bot.handlers.assignments.AssignmentService") as mock_service_cls:
-                mock_service = mock_service_cls.return_value
-                mock_service.get_submission = AsyncMock(return_value=submission)
-
-                with patch("src.bot.handlers.assignments.safe_edit_or_send", new_callable=AsyncMock):
-                    await on_view_submission(callback, i18n, db_user)
-
-                    callback.answer.assert_called_once()
-
-    async def test_submission_with_ai_feedback_no_score(self) -> None:
-        """Test submission with AI feedback but no score (line 514 branch)."""
-        submission = create_mock_submission()
-        submission.ai_feedback = "Good work!"
-        submission.ai_score = None  # No AI score
-        submission.grade = None
-        callback = create_mock_callback(f"assign:submission:{uuid4()}")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-
-        with patch("src.bot.handlers.assignments.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-            with patch("src.bot.handlers.assignments.AssignmentService") as mock_service_cls:
-                mock_service = mock_service_cls.return_value
-                mock_service.get_submission = AsyncMock(return_value=submission)
-
-                with patch("src.bot.handlers.assignments.safe_edit_or_send", new_callable=AsyncMock):
-                    await on_view_submission(callback, i18n, db_user)
-
-                    callback.answer.assert_called_once()
-
-    async def test_submission_with_grade_no_feedback(self) -> None:
-        """Test submission with grade but no teacher feedback (line 519 branch)."""
-        submission = create_mock_submission()
-        submission.grade = 4
-        submission.teacher_feedback = None  # No teacher feedback
-        callback = create_mock_callback(f"assign:submission:{uuid4()}")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-
-        with patch("src.bot.handlers.assignments.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-            with patch("src.bot.handlers.assignments.AssignmentService") as mock_service_cls:
-                mock_service = mock_service_cls.return_value
-                mock_service.get_submission = AsyncMock(return_value=submission)
-
-                with patch("src.bot.handlers.assignments.safe_edit_or_send", new_callable=AsyncMock):
-                    await on_view_submission(callback, i18n, db_user)
-
-                    callback.answer.assert_called_once()
-
-    async def test_submission_without_ai_feedback(self) -> None:
-        """Test submission without AI feedback (line 512 branch)."""
+    @pytest.mark.parametrize(
+        ("grade", "teacher_feedback", "ai_feedback", "ai_score"),
+        [
+            pytest.param(4, "Well done!", "Good job!", 85, id="with_grade"),
+            pytest.param(None, None, "Good work!", None, id="ai_feedback_no_score"),
+            pytest.param(4, None, "Good job!", 85, id="grade_no_feedback"),
+            pytest.param(None, None, None, None, id="without_ai_feedback"),
+        ],
+    )
+    async def test_view_submission_variants(
+        self,
+        grade: int | None,
+        teacher_feedback: str | None,
+        ai_feedback: str | None,
+        ai_score: int | None,
+        mock_callback: MagicMock,
+        mock_i18n: MagicMock,
+        db_user: UserReadDTO,
+        handler_mocks: SimpleNamespace,
+    ) -> None:
         submission = create_mock_submission()
-        submission.ai_feedback = None
-        submission.ai_score = None
-        submission.grade = None
-        callback = create_mock_callback(f"assign:submission:{uuid4()}")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
+        submission.grade = grade
+        submission.teacher_feedback = teacher_feedback
+        submission.ai_feedback = ai_feedback
+        submission.ai_score = ai_score
+        mock_callback.data = f"assign:submission:{ASSIGNMENT_ID}"
 
-        with patch("src.bot.handlers.assignments.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
+        handler_mocks.service.get_submission.return_value = submission
 
-            with patch("src.bot.handlers.assignments.AssignmentService") as mock_service_cls:
-                mock_service = mock_service_cls.return_value
-                mock_service.get_submission = AsyncMock(return_value=submission)
+        await on_view_submission(mock_callback, mock_i18n, db_user)
 
-                with patch("src.bot.handlers.assignments.safe_edit_or_send", new_callable=AsyncMock):
-                    await on_view_submission(callback, i18n, db_user)
-
-                    callback.answer.assert_called_once()
+        mock_callback.answer.assert_called_once()
 
 
 class TestResultDetails:
-    async def test_result_with_teacher_feedback(self) -> None:
-        submission = create_mock_submission()
-        submission.grade = 5
-        submission.teacher_feedback = "Excellent!"
-        callback = create_mock_callback(f"assign:result:{uuid4()}")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-
-        with patch("src.bot.handlers.assignments.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-            with patch("src.bot.handlers.assignments.AssignmentService") as mock_service_cls:
-                mock_service = mock_service_cls.return_value
-                mock_service.get_submission = AsyncMock(return_value=submission)
-
-                with patch("src.bot.handlers.assignments.safe_edit_or_send", new_callable=AsyncMock):
-                    await on_view_result(callback, i18n, db_user)
-
-                    callback.answer.assert_called_once()
-
-    async def test_result_without_ai_score(self) -> None:
+    @pytest.mark.parametrize(
+        ("grade", "teacher_feedback", "ai_feedback", "ai_score"),
+        [
+            pytest.param(5, "Excellent!", "Good job!", 85, id="with_teacher_feedback"),
+            pytest.param(None, None, None, None, id="without_ai_score"),
+        ],
+    )
+    async def test_view_result_variants(
+        self,
+        grade: int | None,
+        teacher_feedback: str | None,
+        ai_feedback: str | None,
+        ai_score: int | None,
+        mock_callback: MagicMock,
+        mock_i18n: MagicMock,
+        db_user: UserReadDTO,
+        handler_mocks: SimpleNamespace,
+    ) -> None:
         submission = create_mock_submission()
-        submission.ai_score = None
-        submission.ai_feedback = None
-        callback = create_mock_callback(f"assign:result:{uuid4()}")
-        i18n = create_mock_i18n()
-        db_user = create_mock_db_user()
-
-        with patch("src.bot.handlers.assignments.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
+        submission.grade = grade
+        submission.teacher_feedback = teacher_feedback
+        submission.ai_feedback = ai_feedback
+        submission.ai_score = ai_score
+        mock_callback.data = f"assign:result:{ASSIGNMENT_ID}"
 
-            with patch("src.bot.handlers.assignments.AssignmentService") as mock_service_cls:
-                mock_service = mock_service_cls.return_value
-                mock_service.get_submission = AsyncMock(return_value=submission)
+        handler_mocks.service.get_submission.return_value = submission
 
-                with patch("src.bot.handlers.assignments.safe_edit_or_send", new_callable=AsyncMock):
-                    await on_view_result(callback, i18n, db_user)
+        await on_view_result(mock_callback, mock_i18n, db_user)
 
-                    callback.answer.assert_called_once()
+        mock_callback.answer.assert_called_once()
@@ -1,14 +1,35 @@
 """Tests for audio handler."""
 
+from collections.abc import Callable
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
-from uuid import uuid4
+from uuid import UUID
 
+import pytest
 from aiogram.exceptions import TelegramBadRequest
 
+from src.bot.handlers import audio as audio_handlers
 from src.bot.handlers.audio import (
     _get_keyboard_for_context,
     on_audio_play,
 )
+from tests.mimic.i18n import I18nRecorder
+
+# The word id is only parsed from callback data, never asserted on.
+_WORD_ID = UUID("00000000-0000-4000-8000-000000000001")
+
+
+@pytest.fixture(autouse=True)
+def handler_mocks(patch_handler_env: Callable[..., SimpleNamespace]) -> SimpleNamespace:
+    """Patch the session maker and service for every test."""
+    return patch_handler_env(audio_handlers, "AudioService")
+
+
+@pytest.fixture
+def mock_message(mock_message: MagicMock) -> MagicMock:
+    """Extend the shared mock Message with `answer_audio`."""
+    mock_message.answer_audio = AsyncMock()
+    return mock_message
 
 
 class TestGetKeyboardForContext:
@@ -16,7 +37,7 @@ class TestGetKeyboardForContext:
 
     def test_returns_learn_keyboard(self, mock_i18n: MagicMock) -> None:
         """Returns learning card keyboard for 'learn' context."""
-        with patch("src.bot.handlers.audio.get_learning_card_keyboard") as mock_keyboard:
+        with patch.object(audio_handlers, "get_learning_card_keyboard") as mock_keyboard:
             mock_keyboard.return_value = MagicMock()
 
             result = _get_keyboard_for_context("learn", mock_i18n)
@@ -26,7 +47,7 @@ class TestGetKeyboardForContext:
 
     def test_returns_review_keyboard(self, mock_i18n: MagicMock) -> None:
         """Returns review rating keyboard for 'review' context."""
-        with patch("src.bot.handlers.audio.get_review_rating_keyboard") as mock_keyboard:
+        with patch.object(audio_handlers, "get_review_rating_keyboard") as mock_keyboard:
             mock_keyboard.return_value = MagicMock()
 
             result = _get_keyboard_for_context("review", mock_i18n)
@@ -36,7 +57,7 @@ class TestGetKeyboardForContext:
 
     def test_returns_voice_keyboard(self, mock_i18n: MagicMock) -> None:
         """Returns voice prompt keyboard for 'voice' context."""
-        with patch("src.bot.handlers.audio.get_voice_prompt_keyboard") as mock_keyboard:
+        with patch.object(audio_handlers, "get_voice_prompt_keyboard") as mock_keyboard:
             mock_keyboard.return_value = MagicMock()
 
             result = _get_keyboard_for_context("voice", mock_i18n)
@@ -84,6 +105,7 @@ class TestOnAudioPlay:
         mock_callback: MagicMock,
         mock_i18n: MagicMock,
         mock_message: MagicMock,
+        record_i18n: I18nRecorder,
     ) -> None:
         """Handler shows error for invalid callback data."""
         mock_callback.data = "audio:play:invalid"  # Missing word_id
@@ -92,62 +114,50 @@ class TestOnAudioPlay:
         await on_audio_play(mock_callback, mock_i18n)
 
         mock_callback.answer.assert_called_once()
-        mock_i18n.get.assert_any_call("audio-error")
+        assert "audio-error" in record_i18n.keys
 
     async def test_shows_loading_and_audio_not_available(
         self,
         mock_callback: MagicMock,
         mock_i18n: MagicMock,
         mock_message: MagicMock,
+        record_i18n: I18nRecorder,
+        handler_mocks: SimpleNamespace,
     ) -> None:
         """Handler shows audio not available message."""
-        word_id = uuid4()
-        mock_callback.data = f"audio:play:learn:{word_id}"
+        mock_callback.data = f"audio:play:learn:{_WORD_ID}"
         mock_callback.message = mock_message
         mock_message.text = "Hello - привет"
 
-        with patch("src.bot.handlers.audio.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-            with patch("src.bot.handlers.audio.AudioService") as mock_service_class:
-                mock_service = mock_service_class.return_value
-                mock_service.get_audio_bytes = AsyncMock(return_value=None)
+        handler_mocks.service.get_audio_bytes.return_value = None
 
-                await on_audio_play(mock_callback, mock_i18n)
+        await on_audio_play(mock_callback, mock_i18n)
 
-        mock_i18n.get.assert_any_call("audio-not-available")
+        assert "audio-not-available" in record_i18n.keys
 
     async def test_plays_audio_successfully(
         self,
         mock_callback: MagicMock,
         mock_i18n: MagicMock,
         mock_message: MagicMock,
+        record_i18n: I18nRecorder,
+        handler_mocks: SimpleNamespace,
     ) -> None:
         """Handler plays audio successfully."""
-        word_id = uuid4()
-        mock_callback.data = f"audio:play:learn:{word_id}"
+        mock_callback.data = f"audio:play:learn:{_WORD_ID}"
         mock_callback.message = mock_message
         mock_message.text = "Hello - привет"
-        mock_message.delete = AsyncMock()
-        mock_message.answer_audio = AsyncMock()
 
         audio_bytes = b"audio data"
 
-        with patch("src.bot.handlers.audio.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-            with patch("src.bot.handlers.audio.AudioService") as mock_service_class:
-                mock_service = mock_service_class.return_value
-                mock_service.get_audio_bytes = AsyncMock(return_value=audio_bytes)
+        handler_mocks.service.get_audio_bytes.return_value = audio_bytes
 
-                with patch("src.bot.handlers.audio._get_keyboard_for_context") as mock_keyboard:
-                    mock_keyboard.return_value = MagicMock()
+        with patch.object(audio_handlers, "_get_keyboard_for_context") as mock_keyboard:
+            mock_keyboard.return_value = MagicMock()
 
-                    await on_audio_play(mock_callback, mock_i18n)
+            await on_audio_play(mock_callback, mock_i18n)
 
-        mock_i18n.get.assert_any_call("audio-loading")
+        assert "audio-loading" in record_i18n.keys
         mock_message.delete.assert_called_once()
         mock_message.answer_audio.assert_called_once()
 
@@ -156,28 +166,23 @@ class TestOnAudioPlay:
         mock_callback: MagicMock,
         mock_i18n: MagicMock,
         mock_message: MagicMock,
+        record_i18n: I18nRecorder,
+        handler_mocks: SimpleNamespace,
     ) -> None:
         """Handler handles TelegramBadRequest when sending audio."""
-        word_id = uuid4()
-        mock_callback.data = f"audio:play:learn:{word_id}"
+        mock_callback.data = f"audio:play:learn:{_WORD_ID}"
         mock_callback.message = mock_message
         mock_message.text = "Hello - привет"
         mock_message.delete = AsyncMock(side_effect=TelegramBadRequest(method=MagicMock(), message="Message not found"))
 
         audio_bytes = b"audio data"
 
-        with patch("src.bot.handlers.audio.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
+        handler_mocks.service.get_audio_bytes.return_value = audio_bytes
 
-            with patch("src.bot.handlers.audio.AudioService") as mock_service_class:
-                mock_service = mock_service_class.return_value
-                mock_service.get_audio_bytes = AsyncMock(return_value=audio_bytes)
-
-                with patch("src.bot.handlers.audio._get_keyboard_for_context") as mock_keyboard:
-                    mock_keyboard.return_value = MagicMock()
+        with patch.object(audio_handlers, "_get_keyboard_for_context") as mock_keyboard:
+            mock_keyboard.return_value = MagicMock()
 
-                    await on_audio_play(mock_callback, mock_i18n)
+            await on_audio_play(mock_callback, mock_i18n)
 
-        mock_i18n.get.assert_any_call("audio-error")
+        assert "audio-error" in record_i18n.keys
         mock_callback.answer.assert_called()
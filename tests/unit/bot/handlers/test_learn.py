@@ -1,8 +1,13 @@
 """Tests for learn handler."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
-from uuid import uuid4
+from collections.abc import Awaitable, Callable
+from types import SimpleNamespace
+from typing import Final
+from unittest.mock import AsyncMock, MagicMock
 
+import pytest
+
+from src.bot.handlers import learn as learn_handlers
 from src.bot.handlers.learn import (
     LearnStates,
     _start_learning_session,
@@ -14,38 +19,92 @@ from src.bot.handlers.learn import (
 )
 from src.modules.users.dto import UserReadDTO
 from src.modules.vocabulary.enums import Language
-
-
-class TestOnLearnStart:
-    """Tests for on_learn_start handler."""
-
-    async def test_returns_early_when_no_message(
+from tests.mimic.aiogram import NOT_A_MESSAGE
+from tests.mimic.i18n import I18nRecorder
+
+WORD_ID_1 = "00000000-0000-4000-8000-000000000001"
+WORD_ID_2 = "00000000-0000-4000-8000-000000000002"
+
+# Read-only `learning_words` state payloads; the handler never mutates them
+_WORD_HELLO: Final = {
+    "id": WORD_ID_1,
+    "word": {"id": WORD_ID_1, "text": "hello", "translation": "привет", "language": "en"},
+}
+_WORD_WORLD: Final = {
+    "id": WORD_ID_2,
+    "word": {"id": WORD_ID_2, "text": "world", "translation": "мир", "language": "en"},
+}
+_WORD_DATA_ONE: Final = (_WORD_HELLO,)
+_WORD_DATA_TWO: Final = (_WORD_HELLO, _WORD_WORLD)
+
+
+@pytest.fixture(autouse=True)
+def handler_mocks(patch_handler_env: Callable[..., SimpleNamespace]) -> SimpleNamespace:
+    """Patch the session maker, services and `safe_edit_or_send` for every test."""
+    return patch_handler_env(learn_handlers, "VocabularyService", safe_edit=True, srs_service="SRSService")
+
+
+class TestEarlyReturn:
+    """Callback handlers return early without callback data or a usable message."""
+
+    @pytest.mark.parametrize(
+        ("handler", "data", "takes_user"),
+        [
+            pytest.param(on_learn_start, "learn:start", True, id="learn_start"),
+            pytest.param(on_learn_language_selected, "learn:lang:en", True, id="learn_language_selected"),
+            pytest.param(on_learn_action, "learn:know", True, id="learn_action"),
+            pytest.param(on_word_add_prompt, "word:add", False, id="word_add_prompt"),
+        ],
+    )
+    @pytest.mark.parametrize(
+        "message",
+        [pytest.param(None, id="no_message"), pytest.param(NOT_A_MESSAGE, id="not_message_type")],
+    )
+    async def test_early_return_without_message(
         self,
+        handler: Callable[..., Awaitable[None]],
+        data: str,
+        takes_user: bool,  # noqa: FBT001
+        message: object,
         mock_callback: MagicMock,
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_state: MagicMock,
     ) -> None:
-        """Handler returns early when callback has no message."""
-        mock_callback.message = None
+        """Handler returns early when the callback has no Message."""
+        mock_callback.data = data
+        mock_callback.message = message
+        args = (mock_callback, mock_i18n, db_user, mock_state) if takes_user else (mock_callback, mock_i18n)
 
-        await on_learn_start(mock_callback, mock_i18n, db_user, mock_state)
+        await handler(*args)
 
         mock_callback.answer.assert_not_called()
+        mock_state.get_data.assert_not_called()
 
-    async def test_returns_early_when_message_not_message_type(
+    @pytest.mark.parametrize(
+        "handler",
+        [on_learn_language_selected, on_learn_action],
+        ids=lambda handler: handler.__name__,
+    )
+    async def test_early_return_without_data(
         self,
+        handler: Callable[..., Awaitable[None]],
         mock_callback: MagicMock,
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_state: MagicMock,
     ) -> None:
-        """Handler returns early when message is not Message type."""
-        mock_callback.message = MagicMock()  # Not a Message instance
+        """Handler returns early when the callback has no data."""
+        mock_callback.data = None
 
-        await on_learn_start(mock_callback, mock_i18n, db_user, mock_state)
+        await handler(mock_callback, mock_i18n, db_user, mock_state)
 
         mock_callback.answer.assert_not_called()
+        mock_state.get_data.assert_not_called()
+
+
+class TestOnLearnStart:
+    """Tests for on_learn_start handler."""
 
     async def test_shows_no_words_message_when_count_zero(
         self,
@@ -54,25 +113,18 @@ class TestOnLearnStart:
         db_user: UserReadDTO,
         mock_state: MagicMock,
         mock_message: MagicMock,
+        handler_mocks: SimpleNamespace,
+        record_i18n: I18nRecorder,
     ) -> None:
         """Handler shows 'no words' when count is 0."""
         mock_callback.message = mock_message
 
-        with (
-            patch("src.bot.handlers.learn.AsyncSessionMaker") as mock_session_maker,
-            patch("src.bot.handlers.learn.safe_edit_or_send", new_callable=AsyncMock) as mock_safe_edit,
-        ):
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
+        handler_mocks.service.count_unlearned_for_language.return_value = 0
 
-            with patch("src.bot.handlers.learn.VocabularyService") as mock_service_class:
-                mock_service = mock_service_class.return_value
-                mock_service.count_unlearned_for_language = AsyncMock(return_value=0)
-
-                await on_learn_start(mock_callback, mock_i18n, db_user, mock_state)
+        await on_learn_start(mock_callback, mock_i18n, db_user, mock_state)
 
-        mock_i18n.get.assert_any_call("learn-no-words-for-pair")
-        mock_safe_edit.assert_called_once()
+        assert "learn-no-words-for-pair" in record_i18n.keys
+        handler_mocks.safe_edit.assert_called_once()
         mock_callback.answer.assert_called_once()
 
     async def test_starts_learning_session_when_words_available(
@@ -82,22 +134,17 @@ class TestOnLearnStart:
         db_user: UserReadDTO,
         mock_state: MagicMock,
         mock_message: MagicMock,
+        handler_mocks: SimpleNamespace,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Handler starts learning session when words are available."""
         mock_callback.message = mock_message
 
-        with (
-            patch("src.bot.handlers.learn.AsyncSessionMaker") as mock_session_maker,
-            patch("src.bot.handlers.learn._start_learning_session", new_callable=AsyncMock) as mock_start,
-        ):
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
+        mock_start = AsyncMock()
+        monkeypatch.setattr(learn_handlers, "_start_learning_session", mock_start)
+        handler_mocks.service.count_unlearned_for_language.return_value = 5
 
-            with patch("src.bot.handlers.learn.VocabularyService") as mock_service_class:
-                mock_service = mock_service_class.return_value
-                mock_service.count_unlearned_for_language = AsyncMock(return_value=5)
-
-                await on_learn_start(mock_callback, mock_i18n, db_user, mock_state)
+        await on_learn_start(mock_callback, mock_i18n, db_user, mock_state)
 
         mock_start.assert_called_once()
         mock_callback.answer.assert_called_once()
@@ -106,92 +153,36 @@ class TestOnLearnStart:
 class TestOnLearnLanguageSelected:
     """Tests for on_learn_language_selected handler."""
 
-    async def test_returns_early_when_no_data_or_message(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        db_user: UserReadDTO,
-        mock_state: MagicMock,
-    ) -> None:
-        """Handler returns early when no data or message."""
-        mock_callback.data = None
-
-        await on_learn_language_selected(mock_callback, mock_i18n, db_user, mock_state)
-
-        mock_callback.answer.assert_not_called()
-
-    async def test_returns_early_when_message_not_message_type(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        db_user: UserReadDTO,
-        mock_state: MagicMock,
-    ) -> None:
-        """Handler returns early when message is not Message type."""
-        mock_callback.data = "learn:lang:en"
-        mock_callback.message = MagicMock()
-
-        await on_learn_language_selected(mock_callback, mock_i18n, db_user, mock_state)
-
-        mock_callback.answer.assert_not_called()
-
-    async def test_selects_english_language(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        db_user: UserReadDTO,
-        mock_state: MagicMock,
-        mock_message: MagicMock,
-    ) -> None:
-        """Handler selects English language."""
-        mock_callback.data = "learn:lang:en"
-        mock_callback.message = mock_message
-
-        with patch("src.bot.handlers.learn._start_learning_session", new_callable=AsyncMock) as mock_start:
-            await on_learn_language_selected(mock_callback, mock_i18n, db_user, mock_state)
-
-        mock_start.assert_called_once()
-        # Check that source_language is Language.EN
-        call_kwargs = mock_start.call_args.kwargs
-        assert call_kwargs["source_language"] is Language.EN
-        mock_callback.answer.assert_called_once()
-
-    async def test_selects_korean_language(
+    @pytest.mark.parametrize(
+        ("data", "expected"),
+        [
+            pytest.param("learn:lang:en", Language.EN, id="english"),
+            pytest.param("learn:lang:ko", Language.KO, id="korean"),
+            pytest.param("learn:lang:mix", None, id="mix"),
+        ],
+    )
+    async def test_selects_language(
         self,
+        data: str,
+        expected: Language | None,
         mock_callback: MagicMock,
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_state: MagicMock,
         mock_message: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
-        """Handler selects Korean language."""
-        mock_callback.data = "learn:lang:ko"
+        """Handler starts a session for the selected language, or all languages for mix."""
+        mock_callback.data = data
         mock_callback.message = mock_message
 
-        with patch("src.bot.handlers.learn._start_learning_session", new_callable=AsyncMock) as mock_start:
-            await on_learn_language_selected(mock_callback, mock_i18n, db_user, mock_state)
-
-        call_kwargs = mock_start.call_args.kwargs
-        assert call_kwargs["source_language"] is Language.KO
-        mock_callback.answer.assert_called_once()
+        mock_start = AsyncMock()
+        monkeypatch.setattr(learn_handlers, "_start_learning_session", mock_start)
 
-    async def test_selects_mix_all_languages(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        db_user: UserReadDTO,
-        mock_state: MagicMock,
-        mock_message: MagicMock,
-    ) -> None:
-        """Handler selects all languages (mix)."""
-        mock_callback.data = "learn:lang:mix"
-        mock_callback.message = mock_message
-
-        with patch("src.bot.handlers.learn._start_learning_session", new_callable=AsyncMock) as mock_start:
-            await on_learn_language_selected(mock_callback, mock_i18n, db_user, mock_state)
+        await on_learn_language_selected(mock_callback, mock_i18n, db_user, mock_state)
 
-        call_kwargs = mock_start.call_args.kwargs
-        assert call_kwargs["source_language"] is None
+        mock_start.assert_called_once()
+        assert mock_start.call_args.kwargs["source_language"] is expected
         mock_callback.answer.assert_called_once()
 
 
@@ -204,23 +195,16 @@ class TestStartLearningSession:
         db_user: UserReadDTO,
         mock_state: MagicMock,
         mock_message: MagicMock,
+        handler_mocks: SimpleNamespace,
+        record_i18n: I18nRecorder,
     ) -> None:
         """Shows 'no words' when no words for learning."""
-        with (
-            patch("src.bot.handlers.learn.AsyncSessionMaker") as mock_session_maker,
-            patch("src.bot.handlers.learn.safe_edit_or_send", new_callable=AsyncMock) as mock_safe_edit,
-        ):
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
+        handler_mocks.service.get_words_for_learning.return_value = []
 
-            with patch("src.bot.handlers.learn.VocabularyService") as mock_service_class:
-                mock_service = mock_service_class.return_value
-                mock_service.get_words_for_learning = AsyncMock(return_value=[])
+        await _start_learning_session(mock_message, mock_i18n, db_user, mock_state, Language.EN)
 
-                await _start_learning_session(mock_message, mock_i18n, db_user, mock_state, Language.EN)
-
-        mock_i18n.get.assert_any_call("learn-no-words")
-        mock_safe_edit.assert_called_once()
+        assert "learn-no-words" in record_i18n.keys
+        handler_mocks.safe_edit.assert_called_once()
 
     async def test_starts_session_and_shows_first_word(
         self,
@@ -228,67 +212,33 @@ class TestStartLearningSession:
         db_user: UserReadDTO,
         mock_state: MagicMock,
         mock_message: MagicMock,
+        handler_mocks: SimpleNamespace,
     ) -> None:
         """Starts session and shows first word."""
-        mock_word = MagicMock()
-        mock_word.word.id = MagicMock()
-        mock_word.word.text = "hello"
-        mock_word.word.translation = "привет"
-        mock_word.word.phonetic = None
-        mock_word.word.example_sentence = None
-        mock_word.word.language = Language.EN
-        mock_word.model_dump = MagicMock(return_value={"id": "123", "word": {}})
-
-        with (
-            patch("src.bot.handlers.learn.AsyncSessionMaker") as mock_session_maker,
-            patch("src.bot.handlers.learn.safe_edit_or_send", new_callable=AsyncMock) as mock_safe_edit,
-        ):
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-            with patch("src.bot.handlers.learn.VocabularyService") as mock_service_class:
-                mock_service = mock_service_class.return_value
-                mock_service.get_words_for_learning = AsyncMock(return_value=[mock_word])
-
-                await _start_learning_session(mock_message, mock_i18n, db_user, mock_state, Language.EN)
+        mock_word = SimpleNamespace(
+            word=SimpleNamespace(
+                id=WORD_ID_1,
+                text="hello",
+                translation="привет",
+                phonetic=None,
+                example_sentence=None,
+                language=Language.EN,
+            ),
+            model_dump=lambda **_: {"id": "123", "word": {}},
+        )
+
+        handler_mocks.service.get_words_for_learning.return_value = [mock_word]
+
+        await _start_learning_session(mock_message, mock_i18n, db_user, mock_state, Language.EN)
 
         mock_state.update_data.assert_called_once()
         mock_state.set_state.assert_called_with(LearnStates.learning_session)
-        mock_safe_edit.assert_called_once()
+        handler_mocks.safe_edit.assert_called_once()
 
 
 class TestOnLearnAction:
     """Tests for on_learn_action handler."""
 
-    async def test_returns_early_when_no_data_or_message(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        db_user: UserReadDTO,
-        mock_state: MagicMock,
-    ) -> None:
-        """Handler returns early when no data or message."""
-        mock_callback.data = None
-
-        await on_learn_action(mock_callback, mock_i18n, db_user, mock_state)
-
-        mock_state.get_data.assert_not_called()
-
-    async def test_returns_early_when_message_not_message_type(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        db_user: UserReadDTO,
-        mock_state: MagicMock,
-    ) -> None:
-        """Handler returns early when message is not Message type."""
-        mock_callback.data = "learn:know"
-        mock_callback.message = MagicMock()
-
-        await on_learn_action(mock_callback, mock_i18n, db_user, mock_state)
-
-        mock_state.get_data.assert_not_called()
-
     async def test_clears_state_when_no_words(
         self,
         mock_callback: MagicMock,
@@ -300,7 +250,7 @@ class TestOnLearnAction:
         """Handler clears state when no words in data."""
         mock_callback.data = "learn:know"
         mock_callback.message = mock_message
-        mock_state.get_data = AsyncMock(return_value={"learning_words": []})
+        mock_state.get_data.return_value = {"learning_words": []}
 
         await on_learn_action(mock_callback, mock_i18n, db_user, mock_state)
 
@@ -314,40 +264,18 @@ class TestOnLearnAction:
         db_user: UserReadDTO,
         mock_state: MagicMock,
         mock_message: MagicMock,
+        handler_mocks: SimpleNamespace,
     ) -> None:
         """Handler marks word as learned on 'know' action."""
         mock_callback.data = "learn:know"
         mock_callback.message = mock_message
 
-        word_id_1 = str(uuid4())
-        word_id_2 = str(uuid4())
-        word_data = [
-            {"id": word_id_1, "word": {"id": word_id_1, "text": "hello", "translation": "привет", "language": "en"}},
-            {"id": word_id_2, "word": {"id": word_id_2, "text": "world", "translation": "мир", "language": "en"}},
-        ]
-        mock_state.get_data = AsyncMock(return_value={"learning_words": word_data, "current_index": 0})
-
-        with (
-            patch("src.bot.handlers.learn.AsyncSessionMaker") as mock_session_maker,
-            patch("src.bot.handlers.learn.safe_edit_or_send", new_callable=AsyncMock),
-        ):
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
+        mock_state.get_data.return_value = {"learning_words": list(_WORD_DATA_TWO), "current_index": 0}
 
-            with (
-                patch("src.bot.handlers.learn.VocabularyService") as mock_vocab_service_class,
-                patch("src.bot.handlers.learn.SRSService") as mock_srs_service_class,
-            ):
-                mock_vocab_service = mock_vocab_service_class.return_value
-                mock_vocab_service.mark_word_learned = AsyncMock()
-
-                mock_srs_service = mock_srs_service_class.return_value
-                mock_srs_service.get_or_create_review = AsyncMock()
-
-                await on_learn_action(mock_callback, mock_i18n, db_user, mock_state)
+        await on_learn_action(mock_callback, mock_i18n, db_user, mock_state)
 
-        mock_vocab_service.mark_word_learned.assert_called_once()
-        mock_srs_service.get_or_create_review.assert_called_once()
+        handler_mocks.service.mark_word_learned.assert_called_once()
+        handler_mocks.srs_service.get_or_create_review.assert_called_once()
 
     async def test_completes_session_on_last_word(
         self,
@@ -356,66 +284,40 @@ class TestOnLearnAction:
         db_user: UserReadDTO,
         mock_state: MagicMock,
         mock_message: MagicMock,
+        handler_mocks: SimpleNamespace,
+        record_i18n: I18nRecorder,
     ) -> None:
         """Handler completes session on last word."""
         mock_callback.data = "learn:skip"
         mock_callback.message = mock_message
 
-        word_id = str(uuid4())
-        word_data = [
-            {"id": word_id, "word": {"id": word_id, "text": "hello", "translation": "привет", "language": "en"}}
-        ]
-        mock_state.get_data = AsyncMock(return_value={"learning_words": word_data, "current_index": 0})
+        mock_state.get_data.return_value = {"learning_words": list(_WORD_DATA_ONE), "current_index": 0}
 
-        with patch("src.bot.handlers.learn.safe_edit_or_send", new_callable=AsyncMock) as mock_safe_edit:
-            await on_learn_action(mock_callback, mock_i18n, db_user, mock_state)
+        await on_learn_action(mock_callback, mock_i18n, db_user, mock_state)
 
         mock_state.clear.assert_called_once()
-        mock_safe_edit.assert_called_once()
-        mock_i18n.get.assert_any_call("learn-session-complete", count=1)
+        handler_mocks.safe_edit.assert_called_once()
+        assert ("learn-session-complete", {"count": 1}) in record_i18n.calls
 
 
 class TestOnWordAddPrompt:
     """Tests for on_word_add_prompt handler."""
 
-    async def test_returns_early_when_no_message(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-    ) -> None:
-        """Handler returns early when no message."""
-        mock_callback.message = None
-
-        await on_word_add_prompt(mock_callback, mock_i18n)
-
-        mock_callback.answer.assert_not_called()
-
-    async def test_returns_early_when_message_not_message_type(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-    ) -> None:
-        """Handler returns early when message is not Message type."""
-        mock_callback.message = MagicMock()
-
-        await on_word_add_prompt(mock_callback, mock_i18n)
-
-        mock_callback.answer.assert_not_called()
-
     async def test_shows_add_prompt(
         self,
         mock_callback: MagicMock,
         mock_i18n: MagicMock,
         mock_message: MagicMock,
+        handler_mocks: SimpleNamespace,
+        record_i18n: I18nRecorder,
     ) -> None:
         """Handler shows word add prompt."""
         mock_callback.message = mock_message
 
-        with patch("src.bot.handlers.learn.safe_edit_or_send", new_callable=AsyncMock) as mock_safe_edit:
-            await on_word_add_prompt(mock_callback, mock_i18n)
+        await on_word_add_prompt(mock_callback, mock_i18n)
 
-        mock_i18n.get.assert_any_call("word-add-prompt")
-        mock_safe_edit.assert_called_once()
+        assert "word-add-prompt" in record_i18n.keys
+        handler_mocks.safe_edit.assert_called_once()
         mock_callback.answer.assert_called_once()
 
 
@@ -430,7 +332,6 @@ class TestOnTranslationInput:
         mock_state: MagicMock,
     ) -> None:
         """Handler clears state when no pending word."""
-        mock_state.get_data = AsyncMock(return_value={})
         mock_message.text = "перевод"
 
         await on_translation_input(mock_message, mock_i18n, db_user, mock_state)
@@ -445,7 +346,7 @@ class TestOnTranslationInput:
         mock_state: MagicMock,
     ) -> None:
         """Handler clears state when no message text."""
-        mock_state.get_data = AsyncMock(return_value={"pending_word": "hello"})
+        mock_state.get_data.return_value = {"pending_word": "hello"}
         mock_message.text = None
 
         await on_translation_input(mock_message, mock_i18n, db_user, mock_state)
@@ -458,26 +359,18 @@ class TestOnTranslationInput:
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_state: MagicMock,
+        handler_mocks: SimpleNamespace,
     ) -> None:
         """Handler adds word with provided translation."""
-        mock_state.get_data = AsyncMock(return_value={"pending_word": "hello"})
+        mock_state.get_data.return_value = {"pending_word": "hello"}
         mock_message.text = "привет"
 
-        mock_user_word = MagicMock()
-        mock_user_word.word.text = "hello"
-        mock_user_word.word.translation = "привет"
-        mock_user_word.word.phonetic = None
-
-        with patch("src.bot.handlers.learn.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
+        mock_user_word = SimpleNamespace(word=SimpleNamespace(text="hello", translation="привет", phonetic=None))
 
-            with patch("src.bot.handlers.learn.VocabularyService") as mock_service_class:
-                mock_service = mock_service_class.return_value
-                mock_service.add_word_with_translation = AsyncMock(return_value=mock_user_word)
+        handler_mocks.service.add_word_with_translation.return_value = mock_user_word
 
-                await on_translation_input(mock_message, mock_i18n, db_user, mock_state)
+        await on_translation_input(mock_message, mock_i18n, db_user, mock_state)
 
-        mock_service.add_word_with_translation.assert_called_once()
+        handler_mocks.service.add_word_with_translation.assert_called_once()
         mock_state.clear.assert_called_once()
         mock_message.answer.assert_called_once()
@@ -1,7 +1,12 @@
 """Tests for menu handler."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from collections.abc import Awaitable, Callable
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
+import pytest
+
+from src.bot.handlers import menu as menu_handlers
 from src.bot.handlers.menu import (
     _build_menu_text,
     on_add_words,
@@ -13,55 +18,72 @@ from src.bot.handlers.menu import (
 )
 from src.modules.users.dto import UserReadDTO
 from src.modules.vocabulary.enums import Language
+from tests.mimic.aiogram import NOT_A_MESSAGE
+from tests.mimic.i18n import I18nRecorder
 
 
-class TestOnMainMenu:
-    """Tests for on_main_menu handler."""
-
-    async def test_returns_early_when_no_message(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        db_user: UserReadDTO,
-    ) -> None:
-        """Handler returns early when callback has no message."""
-        mock_callback.message = None
+@pytest.fixture(autouse=True)
+def handler_mocks(
+    monkeypatch: pytest.MonkeyPatch,
+    patch_handler_env: Callable[..., SimpleNamespace],
+) -> SimpleNamespace:
+    """Patch the session maker, service, word lists and `safe_edit_or_send` for every test."""
+    mocks = patch_handler_env(menu_handlers, "VocabularyService", safe_edit=True)
+    mocks.word_lists = MagicMock(return_value=[])
+    monkeypatch.setattr(menu_handlers, "get_word_lists_by_language", mocks.word_lists)
+    return mocks
 
-        await on_main_menu(mock_callback, mock_i18n, db_user)
 
-        mock_callback.answer.assert_not_called()
+class TestEarlyReturn:
+    """Callback handlers return early without a usable message."""
 
-    async def test_returns_early_when_message_not_message_type(
+    @pytest.mark.parametrize(
+        "handler",
+        [on_main_menu, on_settings, on_change_language, on_change_pair, on_add_words],
+        ids=lambda handler: handler.__name__,
+    )
+    @pytest.mark.parametrize(
+        "message",
+        [pytest.param(None, id="no_message"), pytest.param(NOT_A_MESSAGE, id="not_message_type")],
+    )
+    async def test_early_return(
         self,
+        handler: Callable[..., Awaitable[None]],
+        message: object,
         mock_callback: MagicMock,
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
     ) -> None:
-        """Handler returns early when message is not Message type."""
-        mock_callback.message = MagicMock()  # Not a Message instance
+        """Handler returns early when the callback has no Message."""
+        mock_callback.message = message
 
-        await on_main_menu(mock_callback, mock_i18n, db_user)
+        await handler(mock_callback, mock_i18n, db_user)
 
         mock_callback.answer.assert_not_called()
 
+
+class TestOnMainMenu:
+    """Tests for on_main_menu handler."""
+
     async def test_shows_main_menu(
         self,
         mock_callback: MagicMock,
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_message: MagicMock,
+        handler_mocks: SimpleNamespace,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Handler shows main menu with stats."""
         mock_callback.message = mock_message
 
-        with patch("src.bot.handlers.menu._build_menu_text", new_callable=AsyncMock) as mock_build:
-            mock_build.return_value = "Menu text"
+        mock_build = AsyncMock(return_value="Menu text")
+        monkeypatch.setattr(menu_handlers, "_build_menu_text", mock_build)
 
-            with patch("src.bot.handlers.menu.safe_edit_or_send", new_callable=AsyncMock) as mock_safe_edit:
-                await on_main_menu(mock_callback, mock_i18n, db_user)
+        await on_main_menu(mock_callback, mock_i18n, db_user)
 
         mock_build.assert_called_once_with(mock_i18n, db_user)
-        mock_safe_edit.assert_called_once()
+        handler_mocks.safe_edit.assert_called_once()
         mock_callback.answer.assert_called_once()
 
 
@@ -72,36 +94,27 @@ class TestBuildMenuText:
         self,
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
+        handler_mocks: SimpleNamespace,
+        record_i18n: I18nRecorder,
     ) -> None:
         """Builds menu text with vocabulary stats."""
-        with patch("src.bot.handlers.menu.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-            with patch("src.bot.handlers.menu.VocabularyService") as mock_service_class:
-                mock_service = mock_service_class.return_value
-                mock_service.get_stats_by_language = AsyncMock(return_value={Language.EN: (5, 10)})
+        handler_mocks.service.get_stats_by_language.return_value = {Language.EN: (5, 10)}
 
-                result = await _build_menu_text(mock_i18n, db_user)
+        result = await _build_menu_text(mock_i18n, db_user)
 
         assert isinstance(result, str)
-        mock_i18n.get.assert_any_call("menu-title")
+        assert "menu-title" in record_i18n.keys
 
     async def test_builds_text_without_stats(
         self,
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
+        handler_mocks: SimpleNamespace,
     ) -> None:
         """Builds menu text when no vocabulary stats."""
-        with patch("src.bot.handlers.menu.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
+        handler_mocks.service.get_stats_by_language.return_value = {}
 
-            with patch("src.bot.handlers.menu.VocabularyService") as mock_service_class:
-                mock_service = mock_service_class.return_value
-                mock_service.get_stats_by_language = AsyncMock(return_value={})
-
-                result = await _build_menu_text(mock_i18n, db_user)
+        result = await _build_menu_text(mock_i18n, db_user)
 
         assert isinstance(result, str)
 
@@ -109,188 +122,82 @@ class TestBuildMenuText:
 class TestOnSettings:
     """Tests for on_settings handler."""
 
-    async def test_returns_early_when_no_message(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        db_user: UserReadDTO,
-    ) -> None:
-        """Handler returns early when callback has no message."""
-        mock_callback.message = None
-
-        await on_settings(mock_callback, mock_i18n, db_user)
-
-        mock_callback.answer.assert_not_called()
-
-    async def test_returns_early_when_message_not_message_type(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        db_user: UserReadDTO,
-    ) -> None:
-        """Handler returns early when message is not Message type."""
-        mock_callback.message = MagicMock()
-
-        await on_settings(mock_callback, mock_i18n, db_user)
-
-        mock_callback.answer.assert_not_called()
-
     async def test_shows_settings(
         self,
         mock_callback: MagicMock,
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_message: MagicMock,
+        handler_mocks: SimpleNamespace,
     ) -> None:
         """Handler shows settings screen."""
         mock_callback.message = mock_message
 
-        with patch("src.bot.handlers.menu.safe_edit_or_send", new_callable=AsyncMock) as mock_safe_edit:
-            await on_settings(mock_callback, mock_i18n, db_user)
+        await on_settings(mock_callback, mock_i18n, db_user)
 
-        mock_safe_edit.assert_called_once()
+        handler_mocks.safe_edit.assert_called_once()
         mock_callback.answer.assert_called_once()
 
 
 class TestOnChangeLanguage:
     """Tests for on_change_language handler."""
 
-    async def test_returns_early_when_no_message(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        db_user: UserReadDTO,
-    ) -> None:
-        """Handler returns early when callback has no message."""
-        mock_callback.message = None
-
-        await on_change_language(mock_callback, mock_i18n, db_user)
-
-        mock_callback.answer.assert_not_called()
-
-    async def test_returns_early_when_message_not_message_type(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        db_user: UserReadDTO,
-    ) -> None:
-        """Handler returns early when message is not Message type."""
-        mock_callback.message = MagicMock()
-
-        await on_change_language(mock_callback, mock_i18n, db_user)
-
-        mock_callback.answer.assert_not_called()
-
     async def test_shows_language_selection(
         self,
         mock_callback: MagicMock,
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_message: MagicMock,
+        handler_mocks: SimpleNamespace,
     ) -> None:
         """Handler shows language selection screen."""
         mock_callback.message = mock_message
 
-        with patch("src.bot.handlers.menu.safe_edit_or_send", new_callable=AsyncMock) as mock_safe_edit:
-            await on_change_language(mock_callback, mock_i18n, db_user)
+        await on_change_language(mock_callback, mock_i18n, db_user)
 
-        mock_safe_edit.assert_called_once()
+        handler_mocks.safe_edit.assert_called_once()
         mock_callback.answer.assert_called_once()
 
 
 class TestOnChangePair:
     """Tests for on_change_pair handler."""
 
-    async def test_returns_early_when_no_message(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        db_user: UserReadDTO,
-    ) -> None:
-        """Handler returns early when callback has no message."""
-        mock_callback.message = None
-
-        await on_change_pair(mock_callback, mock_i18n, db_user)
-
-        mock_callback.answer.assert_not_called()
-
-    async def test_returns_early_when_message_not_message_type(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        db_user: UserReadDTO,
-    ) -> None:
-        """Handler returns early when message is not Message type."""
-        mock_callback.message = MagicMock()
-
-        await on_change_pair(mock_callback, mock_i18n, db_user)
-
-        mock_callback.answer.assert_not_called()
-
     async def test_shows_pair_selection(
         self,
         mock_callback: MagicMock,
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_message: MagicMock,
+        handler_mocks: SimpleNamespace,
     ) -> None:
         """Handler shows pair selection screen."""
         mock_callback.message = mock_message
 
-        with patch("src.bot.handlers.menu.safe_edit_or_send", new_callable=AsyncMock) as mock_safe_edit:
-            await on_change_pair(mock_callback, mock_i18n, db_user)
+        await on_change_pair(mock_callback, mock_i18n, db_user)
 
-        mock_safe_edit.assert_called_once()
+        handler_mocks.safe_edit.assert_called_once()
         mock_callback.answer.assert_called_once()
 
 
 class TestOnAddWords:
     """Tests for on_add_words handler."""
 
-    async def test_returns_early_when_no_message(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        db_user: UserReadDTO,
-    ) -> None:
-        """Handler returns early when callback has no message."""
-        mock_callback.message = None
-
-        await on_add_words(mock_callback, mock_i18n, db_user)
-
-        mock_callback.answer.assert_not_called()
-
-    async def test_returns_early_when_message_not_message_type(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        db_user: UserReadDTO,
-    ) -> None:
-        """Handler returns early when message is not Message type."""
-        mock_callback.message = MagicMock()
-
-        await on_add_words(mock_callback, mock_i18n, db_user)
-
-        mock_callback.answer.assert_not_called()
-
     async def test_shows_empty_message_when_no_lists(
         self,
         mock_callback: MagicMock,
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_message: MagicMock,
+        handler_mocks: SimpleNamespace,
+        record_i18n: I18nRecorder,
     ) -> None:
         """Handler shows empty message when no word lists available."""
         mock_callback.message = mock_message
 
-        with (
-            patch("src.bot.handlers.menu.get_word_lists_by_language", return_value=[]),
-            patch("src.bot.handlers.menu.safe_edit_or_send", new_callable=AsyncMock) as mock_safe_edit,
-        ):
-            await on_add_words(mock_callback, mock_i18n, db_user)
+        await on_add_words(mock_callback, mock_i18n, db_user)
 
-        mock_i18n.get.assert_any_call("lists-empty")
-        mock_safe_edit.assert_called_once()
+        assert "lists-empty" in record_i18n.keys
+        handler_mocks.safe_edit.assert_called_once()
         mock_callback.answer.assert_called_once()
 
     async def test_shows_word_lists(
@@ -299,22 +206,20 @@ class TestOnAddWords:
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_message: MagicMock,
+        handler_mocks: SimpleNamespace,
+        record_i18n: I18nRecorder,
     ) -> None:
         """Handler shows word lists keyboard."""
         mock_callback.message = mock_message
 
-        mock_word_list = MagicMock()
-        mock_word_list.id = "test_list"
-        mock_word_list.get_name = MagicMock(return_value="Test List")
+        mock_word_list = SimpleNamespace(id="test_list", get_name=lambda _lang: "Test List")
+
+        handler_mocks.word_lists.return_value = [mock_word_list]
 
-        with (
-            patch("src.bot.handlers.menu.get_word_lists_by_language", return_value=[mock_word_list]),
-            patch("src.bot.handlers.menu.safe_edit_or_send", new_callable=AsyncMock) as mock_safe_edit,
-        ):
-            await on_add_words(mock_callback, mock_i18n, db_user)
+        await on_add_words(mock_callback, mock_i18n, db_user)
 
-        mock_i18n.get.assert_any_call("lists-title")
-        mock_safe_edit.assert_called_once()
+        assert "lists-title" in record_i18n.keys
+        handler_mocks.safe_edit.assert_called_once()
         mock_callback.answer.assert_called_once()
 
 
@@ -326,9 +231,10 @@ class TestOnComingSoon:
         mock_callback: MagicMock,
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
+        record_i18n: I18nRecorder,
     ) -> None:
         """Handler shows coming soon alert."""
         await on_coming_soon(mock_callback, mock_i18n, db_user)
 
         mock_callback.answer.assert_called_once()
-        mock_i18n.get.assert_any_call("coming-soon")
+        assert "coming-soon" in record_i18n.keys
@@ -1,9 +1,14 @@
 """Tests for review handler."""
 
-from datetime import UTC, datetime
-from unittest.mock import AsyncMock, MagicMock, patch
-from uuid import uuid4
+from collections.abc import Awaitable, Callable
+from types import SimpleNamespace
+from typing import Final
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
 
+import pytest
+
+from src.bot.handlers import review as review_handlers
 from src.bot.handlers.review import (
     ReviewStates,
     on_review_begin,
@@ -11,41 +16,102 @@ from src.bot.handlers.review import (
     on_review_show_answer,
     on_review_start,
 )
-from src.modules.srs.dto import ReviewWithWordDTO
+from src.modules.srs.dto import ReviewSessionStatsDTO, ReviewWithWordDTO
 from src.modules.users.dto import UserReadDTO
-
-
-class TestOnReviewStart:
-    """Tests for on_review_start handler."""
-
-    async def test_returns_early_when_no_message(
+from tests.mimic.aiogram import NOT_A_MESSAGE
+from tests.mimic.clock import FIXED_DT
+from tests.mimic.i18n import I18nRecorder
+
+REVIEW_ID_1 = UUID("00000000-0000-4000-8000-000000000001")
+REVIEW_ID_2 = UUID("00000000-0000-4000-8000-000000000002")
+USER_WORD_ID = UUID("00000000-0000-4000-8000-000000000003")
+WORD_ID = UUID("00000000-0000-4000-8000-000000000004")
+
+_SESSION_START_ISO: Final = FIXED_DT.isoformat()
+
+
+@pytest.fixture(scope="session")
+def sample_review_dto() -> ReviewWithWordDTO:
+    """A due review; handlers only read it, so it is validated once per session."""
+    return ReviewWithWordDTO(
+        id=REVIEW_ID_1,
+        user_word_id=USER_WORD_ID,
+        word_id=WORD_ID,
+        word_text="hello",
+        word_phonetic="/helo/",
+        translation="привет",
+        example_sentence="Hello world",
+        next_review=FIXED_DT,
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_stats_dto() -> ReviewSessionStatsDTO:
+    """Stats for a one-word review session."""
+    return ReviewSessionStatsDTO(total_reviewed=1, average_quality=5.0, time_spent_seconds=60)
+
+
+@pytest.fixture(autouse=True)
+def handler_mocks(patch_handler_env: Callable[..., SimpleNamespace]) -> SimpleNamespace:
+    """Patch the session maker and `SRSService` for every test."""
+    return patch_handler_env(review_handlers, "SRSService")
+
+
+class TestEarlyReturn:
+    """Callback handlers return early without callback data or a usable message."""
+
+    @pytest.mark.parametrize(
+        ("handler", "data", "takes_user"),
+        [
+            pytest.param(on_review_start, "review:start", True, id="review_start"),
+            pytest.param(on_review_begin, "review:begin", True, id="review_begin"),
+            pytest.param(on_review_show_answer, "review:show", False, id="review_show_answer"),
+            pytest.param(on_review_rate, "review:rate:5", False, id="review_rate"),
+        ],
+    )
+    @pytest.mark.parametrize(
+        "message",
+        [pytest.param(None, id="no_message"), pytest.param(NOT_A_MESSAGE, id="not_message_type")],
+    )
+    async def test_early_return_without_message(
         self,
+        handler: Callable[..., Awaitable[None]],
+        data: str,
+        takes_user: bool,  # noqa: FBT001
+        message: object,
         mock_callback: MagicMock,
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_state: MagicMock,
     ) -> None:
-        """Handler returns early when callback has no message."""
-        mock_callback.message = None
+        """Handler returns early when the callback has no Message."""
+        mock_callback.data = data
+        mock_callback.message = message
+        args = (mock_callback, mock_i18n, db_user, mock_state) if takes_user else (mock_callback, mock_i18n, mock_state)
 
-        await on_review_start(mock_callback, mock_i18n, db_user, mock_state)
+        await handler(*args)
 
         mock_callback.answer.assert_not_called()
+        mock_state.clear.assert_not_called()
+        mock_state.get_data.assert_not_called()
 
-    async def test_returns_early_when_message_not_message_type(
+    async def test_rate_returns_early_without_data(
         self,
         mock_callback: MagicMock,
         mock_i18n: MagicMock,
-        db_user: UserReadDTO,
         mock_state: MagicMock,
     ) -> None:
-        """Handler returns early when message is not Message type."""
-        mock_callback.message = MagicMock()  # Not a Message instance
+        """Rating handler returns early when the callback has no data."""
+        mock_callback.data = None
 
-        await on_review_start(mock_callback, mock_i18n, db_user, mock_state)
+        await on_review_rate(mock_callback, mock_i18n, mock_state)
+
+        mock_callback.answer.assert_not_called()
+        mock_state.get_data.assert_not_called()
 
-        # Should return early, no state clear
-        mock_state.clear.assert_not_called()
+
+class TestOnReviewStart:
+    """Tests for on_review_start handler."""
 
     async def test_shows_no_words_due_when_count_zero(
         self,
@@ -54,22 +120,18 @@ class TestOnReviewStart:
         db_user: UserReadDTO,
         mock_state: MagicMock,
         mock_message: MagicMock,
+        record_i18n: I18nRecorder,
+        handler_mocks: SimpleNamespace,
     ) -> None:
         """Shows 'no words due' message when count is 0."""
         mock_callback.message = mock_message
 
-        with patch("src.bot.handlers.review.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
+        handler_mocks.service.count_due_reviews.return_value = 0
 
-            with patch("src.bot.handlers.review.SRSService") as mock_service_class:
-                mock_service = mock_service_class.return_value
-                mock_service.count_due_reviews = AsyncMock(return_value=0)
-
-                await on_review_start(mock_callback, mock_i18n, db_user, mock_state)
+        await on_review_start(mock_callback, mock_i18n, db_user, mock_state)
 
         mock_callback.answer.assert_called_once()
-        mock_i18n.get.assert_any_call("review-no-words-due")
+        assert "review-no-words-due" in record_i18n.keys
 
     async def test_shows_due_count_when_words_available(
         self,
@@ -78,41 +140,23 @@ class TestOnReviewStart:
         db_user: UserReadDTO,
         mock_state: MagicMock,
         mock_message: MagicMock,
+        record_i18n: I18nRecorder,
+        handler_mocks: SimpleNamespace,
     ) -> None:
         """Shows start screen with due count when words are available."""
         mock_callback.message = mock_message
 
-        with patch("src.bot.handlers.review.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
+        handler_mocks.service.count_due_reviews.return_value = 5
 
-            with patch("src.bot.handlers.review.SRSService") as mock_service_class:
-                mock_service = mock_service_class.return_value
-                mock_service.count_due_reviews = AsyncMock(return_value=5)
-
-                await on_review_start(mock_callback, mock_i18n, db_user, mock_state)
+        await on_review_start(mock_callback, mock_i18n, db_user, mock_state)
 
         mock_callback.answer.assert_called_once()
-        mock_i18n.get.assert_any_call("review-start", count=5)
+        assert ("review-start", {"count": 5}) in record_i18n.calls
 
 
 class TestOnReviewBegin:
     """Tests for on_review_begin handler."""
 
-    async def test_returns_early_when_no_message(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        db_user: UserReadDTO,
-        mock_state: MagicMock,
-    ) -> None:
-        """Handler returns early when callback has no message."""
-        mock_callback.message = None
-
-        await on_review_begin(mock_callback, mock_i18n, db_user, mock_state)
-
-        mock_callback.answer.assert_not_called()
-
     async def test_shows_no_words_when_reviews_empty(
         self,
         mock_callback: MagicMock,
@@ -120,21 +164,17 @@ class TestOnReviewBegin:
         db_user: UserReadDTO,
         mock_state: MagicMock,
         mock_message: MagicMock,
+        record_i18n: I18nRecorder,
+        handler_mocks: SimpleNamespace,
     ) -> None:
         """Shows 'no words' when reviews list is empty."""
         mock_callback.message = mock_message
 
-        with patch("src.bot.handlers.review.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-            with patch("src.bot.handlers.review.SRSService") as mock_service_class:
-                mock_service = mock_service_class.return_value
-                mock_service.get_due_reviews = AsyncMock(return_value=[])
+        handler_mocks.service.get_due_reviews.return_value = []
 
-                await on_review_begin(mock_callback, mock_i18n, db_user, mock_state)
+        await on_review_begin(mock_callback, mock_i18n, db_user, mock_state)
 
-        mock_i18n.get.assert_any_call("review-no-words-due")
+        assert "review-no-words-due" in record_i18n.keys
 
     async def test_begins_session_with_reviews(
         self,
@@ -143,30 +183,15 @@ class TestOnReviewBegin:
         db_user: UserReadDTO,
         mock_state: MagicMock,
         mock_message: MagicMock,
+        handler_mocks: SimpleNamespace,
+        sample_review_dto: ReviewWithWordDTO,
     ) -> None:
         """Begins review session and shows first question."""
         mock_callback.message = mock_message
 
-        review = ReviewWithWordDTO(
-            id=uuid4(),
-            user_word_id=uuid4(),
-            word_id=uuid4(),
-            word_text="hello",
-            word_phonetic="/helo/",
-            translation="привет",
-            example_sentence="Hello world",
-            next_review=datetime.now(tz=UTC),
-        )
-
-        with patch("src.bot.handlers.review.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
+        handler_mocks.service.get_due_reviews.return_value = [sample_review_dto]
 
-            with patch("src.bot.handlers.review.SRSService") as mock_service_class:
-                mock_service = mock_service_class.return_value
-                mock_service.get_due_reviews = AsyncMock(return_value=[review])
-
-                await on_review_begin(mock_callback, mock_i18n, db_user, mock_state)
+        await on_review_begin(mock_callback, mock_i18n, db_user, mock_state)
 
         mock_state.update_data.assert_called_once()
         mock_state.set_state.assert_called_with(ReviewStates.reviewing)
@@ -175,19 +200,6 @@ class TestOnReviewBegin:
 class TestOnReviewShowAnswer:
     """Tests for on_review_show_answer handler."""
 
-    async def test_returns_early_when_no_message(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        mock_state: MagicMock,
-    ) -> None:
-        """Handler returns early when callback has no message."""
-        mock_callback.message = None
-
-        await on_review_show_answer(mock_callback, mock_i18n, mock_state)
-
-        mock_state.get_data.assert_not_called()
-
     async def test_clears_state_when_no_reviews(
         self,
         mock_callback: MagicMock,
@@ -213,8 +225,8 @@ class TestOnReviewShowAnswer:
         """Shows answer with phonetic when available."""
         mock_callback.message = mock_message
         review_data = {
-            "id": str(uuid4()),
-            "word_id": str(uuid4()),
+            "id": str(REVIEW_ID_1),
+            "word_id": str(WORD_ID),
             "word_text": "hello",
             "word_phonetic": "/helo/",
             "translation": "привет",
@@ -231,20 +243,6 @@ class TestOnReviewShowAnswer:
 class TestOnReviewRate:
     """Tests for on_review_rate handler."""
 
-    async def test_returns_early_when_no_data_or_message(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        mock_state: MagicMock,
-    ) -> None:
-        """Handler returns early when callback has no data or message."""
-        mock_callback.data = None
-        mock_callback.message = MagicMock()
-
-        await on_review_rate(mock_callback, mock_i18n, mock_state)
-
-        mock_state.get_data.assert_not_called()
-
     async def test_clears_state_when_no_reviews(
         self,
         mock_callback: MagicMock,
@@ -273,28 +271,19 @@ class TestOnReviewRate:
         mock_callback.data = "review:rate:4"
 
         review_data = [
-            {"id": str(uuid4()), "translation": "привет"},
-            {"id": str(uuid4()), "translation": "мир"},
+            {"id": str(REVIEW_ID_1), "translation": "привет"},
+            {"id": str(REVIEW_ID_2), "translation": "мир"},
         ]
         mock_state.get_data = AsyncMock(
             return_value={
                 "reviews": review_data,
                 "current_index": 0,
                 "reviewed_ids": [],
-                "session_start": datetime.now(tz=UTC).isoformat(),
+                "session_start": _SESSION_START_ISO,
             }
         )
 
-        with patch("src.bot.handlers.review.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session.commit = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-            with patch("src.bot.handlers.review.SRSService") as mock_service_class:
-                mock_service = mock_service_class.return_value
-                mock_service.record_review = AsyncMock()
-
-                await on_review_rate(mock_callback, mock_i18n, mock_state)
+        await on_review_rate(mock_callback, mock_i18n, mock_state)
 
         mock_state.update_data.assert_called()
         mock_state.set_state.assert_called_with(ReviewStates.reviewing)
@@ -305,40 +294,27 @@ class TestOnReviewRate:
         mock_i18n: MagicMock,
         mock_state: MagicMock,
         mock_message: MagicMock,
+        record_i18n: I18nRecorder,
+        handler_mocks: SimpleNamespace,
+        sample_stats_dto: ReviewSessionStatsDTO,
     ) -> None:
         """Completes session and shows stats on last word."""
         mock_callback.message = mock_message
         mock_callback.data = "review:rate:5"
 
-        review_data = [{"id": str(uuid4()), "translation": "привет"}]
+        review_data = [{"id": str(REVIEW_ID_1), "translation": "привет"}]
         mock_state.get_data = AsyncMock(
             return_value={
                 "reviews": review_data,
                 "current_index": 0,
                 "reviewed_ids": [],
-                "session_start": datetime.now(tz=UTC).isoformat(),
+                "session_start": _SESSION_START_ISO,
             }
         )
 
-        with patch("src.bot.handlers.review.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session.commit = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-            with patch("src.bot.handlers.review.SRSService") as mock_service_class:
-                from src.modules.srs.dto import ReviewSessionStatsDTO
+        handler_mocks.service.get_session_stats.return_value = sample_stats_dto
 
-                mock_service = mock_service_class.return_value
-                mock_service.record_review = AsyncMock()
-                mock_service.get_session_stats = AsyncMock(
-                    return_value=ReviewSessionStatsDTO(
-                        total_reviewed=1,
-                        average_quality=5.0,
-                        time_spent_seconds=60,
-                    )
-                )
-
-                await on_review_rate(mock_callback, mock_i18n, mock_state)
+        await on_review_rate(mock_callback, mock_i18n, mock_state)
 
         mock_state.clear.assert_called_once()
-        mock_i18n.get.assert_any_call("review-session-ended")
+        assert "review-session-ended" in record_i18n.keys
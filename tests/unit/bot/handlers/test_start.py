@@ -1,13 +1,27 @@
 """Tests for start handler."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from collections.abc import Awaitable, Callable
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
+import pytest
+
+from src.bot.handlers import start as start_handlers
 from src.bot.handlers.start import (
     cmd_start,
     on_language_selected,
     on_pair_selected,
 )
 from src.modules.users.dto import UserReadDTO
+from tests.mimic.aiogram import NOT_A_MESSAGE
+from tests.mimic.calls import CallRecorder
+from tests.mimic.i18n import I18nRecorder
+
+
+@pytest.fixture(autouse=True)
+def handler_mocks(patch_handler_env: Callable[..., SimpleNamespace]) -> SimpleNamespace:
+    """Patch the session maker and `UserService` for every test."""
+    return patch_handler_env(start_handlers, "UserService")
 
 
 class TestCmdStart:
@@ -18,6 +32,7 @@ class TestCmdStart:
         mock_message: MagicMock,
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
+        record_i18n: I18nRecorder,
     ) -> None:
         """Handler sends welcome message with language selection."""
         mock_command = MagicMock()
@@ -26,25 +41,26 @@ class TestCmdStart:
         await cmd_start(mock_message, mock_i18n, db_user, mock_command)
 
         mock_message.answer.assert_called_once()
-        mock_i18n.get.assert_any_call("welcome")
-        mock_i18n.get.assert_any_call("welcome-choose-lang")
+        assert "welcome" in record_i18n.keys
+        assert "welcome-choose-lang" in record_i18n.keys
 
     async def test_handles_deep_link_join(
         self,
         mock_message: MagicMock,
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Handler handles deep link join."""
         mock_command = MagicMock()
         mock_command.args = "join_ABC123DEF456"
 
-        with patch("src.bot.handlers.start.handle_deep_link_join", new_callable=AsyncMock) as mock_handle:
-            mock_handle.return_value = True
+        mock_handle = CallRecorder(True)
+        monkeypatch.setattr(start_handlers, "handle_deep_link_join", mock_handle)
 
-            await cmd_start(mock_message, mock_i18n, db_user, mock_command)
+        await cmd_start(mock_message, mock_i18n, db_user, mock_command)
 
-        mock_handle.assert_called_once_with(mock_message, mock_i18n, db_user, "ABC123DEF456")
+        assert mock_handle.calls == [((mock_message, mock_i18n, db_user, "ABC123DEF456"), {})]
         mock_message.answer.assert_not_called()
 
     async def test_continues_to_welcome_when_join_fails(
@@ -52,62 +68,77 @@ class TestCmdStart:
         mock_message: MagicMock,
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Handler shows welcome when deep link join fails."""
         mock_command = MagicMock()
         mock_command.args = "join_INVALID"
 
-        with patch("src.bot.handlers.start.handle_deep_link_join", new_callable=AsyncMock) as mock_handle:
-            mock_handle.return_value = False
+        mock_handle = CallRecorder(False)
+        monkeypatch.setattr(start_handlers, "handle_deep_link_join", mock_handle)
 
-            await cmd_start(mock_message, mock_i18n, db_user, mock_command)
+        await cmd_start(mock_message, mock_i18n, db_user, mock_command)
 
         mock_message.answer.assert_called_once()
 
 
-class TestOnLanguageSelected:
-    """Tests for on_language_selected handler."""
-
-    async def test_returns_early_when_no_data(
+class TestEarlyReturn:
+    """Settings callback handlers return early without callback data or a usable message."""
+
+    @pytest.mark.parametrize(
+        ("handler", "data"),
+        [
+            pytest.param(on_language_selected, "settings:lang:en", id="language_selected"),
+            pytest.param(on_pair_selected, "settings:pair:en_ru", id="pair_selected"),
+        ],
+    )
+    @pytest.mark.parametrize(
+        "message",
+        [pytest.param(None, id="no_message"), pytest.param(NOT_A_MESSAGE, id="not_message_type")],
+    )
+    async def test_early_return_without_message(
         self,
+        handler: Callable[..., Awaitable[None]],
+        data: str,
+        message: object,
         mock_callback: MagicMock,
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
+        handler_mocks: SimpleNamespace,
     ) -> None:
-        """Handler returns early when callback has no data."""
-        mock_callback.data = None
+        """Handler returns early when the callback has no Message."""
+        mock_callback.data = data
+        mock_callback.message = message
 
-        await on_language_selected(mock_callback, mock_i18n, db_user)
+        await handler(mock_callback, mock_i18n, db_user)
 
         mock_callback.answer.assert_not_called()
-
-    async def test_returns_early_when_no_message(
+        handler_mocks.service.update.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "handler",
+        [on_language_selected, on_pair_selected],
+        ids=lambda handler: handler.__name__,
+    )
+    async def test_early_return_without_data(
         self,
+        handler: Callable[..., Awaitable[None]],
         mock_callback: MagicMock,
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
+        handler_mocks: SimpleNamespace,
     ) -> None:
-        """Handler returns early when callback has no message."""
-        mock_callback.data = "settings:lang:en"
-        mock_callback.message = None
+        """Handler returns early when the callback has no data."""
+        mock_callback.data = None
 
-        await on_language_selected(mock_callback, mock_i18n, db_user)
+        await handler(mock_callback, mock_i18n, db_user)
 
         mock_callback.answer.assert_not_called()
+        handler_mocks.service.update.assert_not_called()
 
-    async def test_returns_early_when_message_not_message_type(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        db_user: UserReadDTO,
-    ) -> None:
-        """Handler returns early when message is not Message type."""
-        mock_callback.data = "settings:lang:en"
-        mock_callback.message = MagicMock()  # Not a Message instance
-
-        await on_language_selected(mock_callback, mock_i18n, db_user)
 
-        mock_callback.answer.assert_not_called()
+class TestOnLanguageSelected:
+    """Tests for on_language_selected handler."""
 
     async def test_updates_language_and_shows_pair_selection(
         self,
@@ -115,22 +146,15 @@ class TestOnLanguageSelected:
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_message: MagicMock,
+        handler_mocks: SimpleNamespace,
     ) -> None:
         """Handler updates language and shows pair selection."""
         mock_callback.data = "settings:lang:en"
         mock_callback.message = mock_message
 
-        with patch("src.bot.handlers.start.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-            with patch("src.bot.handlers.start.UserService") as mock_service_class:
-                mock_service = mock_service_class.return_value
-                mock_service.update = AsyncMock()
-
-                await on_language_selected(mock_callback, mock_i18n, db_user)
+        await on_language_selected(mock_callback, mock_i18n, db_user)
 
-        mock_service.update.assert_called_once()
+        handler_mocks.service.update.assert_called_once()
         mock_i18n.set_locale.assert_called_with("en")
         mock_message.edit_text.assert_called_once()
         mock_callback.answer.assert_called_once()
@@ -139,71 +163,25 @@ class TestOnLanguageSelected:
 class TestOnPairSelected:
     """Tests for on_pair_selected handler."""
 
-    async def test_returns_early_when_no_data(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        db_user: UserReadDTO,
-    ) -> None:
-        """Handler returns early when callback has no data."""
-        mock_callback.data = None
-
-        await on_pair_selected(mock_callback, mock_i18n, db_user)
-
-        mock_callback.answer.assert_not_called()
-
-    async def test_returns_early_when_no_message(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        db_user: UserReadDTO,
-    ) -> None:
-        """Handler returns early when callback has no message."""
-        mock_callback.data = "settings:pair:en_ru"
-        mock_callback.message = None
-
-        await on_pair_selected(mock_callback, mock_i18n, db_user)
-
-        mock_callback.answer.assert_not_called()
-
-    async def test_returns_early_when_message_not_message_type(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        db_user: UserReadDTO,
-    ) -> None:
-        """Handler returns early when message is not Message type."""
-        mock_callback.data = "settings:pair:en_ru"
-        mock_callback.message = MagicMock()  # Not a Message instance
-
-        await on_pair_selected(mock_callback, mock_i18n, db_user)
-
-        mock_callback.answer.assert_not_called()
-
     async def test_updates_pair_and_shows_main_menu(
         self,
         mock_callback: MagicMock,
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_message: MagicMock,
+        handler_mocks: SimpleNamespace,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Handler updates language pair and shows main menu."""
         mock_callback.data = "settings:pair:en_ru"
         mock_callback.message = mock_message
 
-        with patch("src.bot.handlers.start.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-            with patch("src.bot.handlers.start.UserService") as mock_service_class:
-                mock_service = mock_service_class.return_value
-                mock_service.update = AsyncMock(return_value=db_user)
+        handler_mocks.service.update.return_value = db_user
 
-                with patch("src.bot.handlers.start._build_menu_text", new_callable=AsyncMock) as mock_build:
-                    mock_build.return_value = "Menu text"
+        monkeypatch.setattr(start_handlers, "_build_menu_text", AsyncMock(return_value="Menu text"))
 
-                    await on_pair_selected(mock_callback, mock_i18n, db_user)
+        await on_pair_selected(mock_callback, mock_i18n, db_user)
 
-        mock_service.update.assert_called_once()
+        handler_mocks.service.update.assert_called_once()
         mock_message.edit_text.assert_called_once()
         mock_callback.answer.assert_called_once()
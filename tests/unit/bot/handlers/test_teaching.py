@@ -1,8 +1,14 @@
 """Tests for teaching handlers."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
-from uuid import uuid4
+from collections.abc import Awaitable, Callable
+from types import SimpleNamespace
+from typing import Final
+from unittest.mock import MagicMock
+from uuid import UUID
 
+import pytest
+
+from src.bot.handlers import teaching as teaching_handlers
 from src.bot.handlers.teaching import (
     handle_deep_link_join,
     on_become_teacher,
@@ -26,39 +32,101 @@ from src.core.exceptions import ConflictError, NotFoundError, ValidationError
 from src.modules.teaching.dto import InviteCodeDTO, TeacherDashboardStatsDTO, TeacherStudentWithUserDTO
 from src.modules.teaching.enums import TeacherStudentStatus
 from src.modules.users.dto import UserReadDTO
+from tests.mimic.aiogram import NOT_A_MESSAGE
+from tests.mimic.i18n import I18nRecorder
+
+STUDENT_USER_ID = UUID("00000000-0000-4000-8000-000000000001")
+_CB_STUDENT_DETAIL: Final = f"teaching:student:{STUDENT_USER_ID}"
+_CB_REMOVE: Final = f"teaching:remove:{STUDENT_USER_ID}"
+_CB_REMOVE_CONFIRM: Final = f"teaching:remove:confirm:{STUDENT_USER_ID}"
+
+# Handlers only read these; validating them once keeps the test bodies cheap
+_STUDENT = TeacherStudentWithUserDTO(
+    id=UUID("00000000-0000-4000-8000-000000000002"),
+    user_id=STUDENT_USER_ID,
+    username="student1",
+    first_name="Student One",
+    status=TeacherStudentStatus.ACTIVE,
+)
+_TEACHER = TeacherStudentWithUserDTO(
+    id=UUID("00000000-0000-4000-8000-000000000003"),
+    user_id=UUID("00000000-0000-4000-8000-000000000004"),
+    username="teacher1",
+    first_name="Teacher",
+    status=TeacherStudentStatus.ACTIVE,
+)
 
 
-class TestOnRoleSelection:
-    """Tests for on_role_selection handler."""
-
-    async def test_returns_early_when_no_message(
-        self,
+@pytest.fixture(autouse=True)
+def handler_mocks(patch_handler_env: Callable[..., SimpleNamespace]) -> SimpleNamespace:
+    """Patch the session maker, service and `safe_edit_or_send` for every test."""
+    return patch_handler_env(teaching_handlers, "TeachingService", safe_edit=True)
+
+
+class TestEarlyReturn:
+    """Callback handlers return early without a usable message."""
+
+    @pytest.mark.parametrize(
+        ("handler", "data", "takes_state"),
+        [
+            pytest.param(on_role_selection, "teaching:role", True, id="role_selection"),
+            pytest.param(on_become_teacher, "teaching:become", False, id="become_teacher"),
+            pytest.param(on_teacher_dashboard, "teaching:dashboard", False, id="teacher_dashboard"),
+            pytest.param(on_student_list, "teaching:students", False, id="student_list"),
+            pytest.param(on_student_detail, "teaching:student:abc", False, id="student_detail"),
+            pytest.param(on_remove_student, "teaching:remove:abc", False, id="remove_student"),
+            pytest.param(on_show_invite, "teaching:invite", False, id="show_invite"),
+            pytest.param(on_regenerate_invite, "teaching:invite:regenerate", False, id="regenerate_invite"),
+            pytest.param(on_join_teacher_prompt, "teaching:join", True, id="join_teacher_prompt"),
+            pytest.param(on_student_panel, "teaching:panel", False, id="student_panel"),
+            pytest.param(on_leave_teacher, "teaching:leave", False, id="leave_teacher"),
+            pytest.param(on_leave_teacher_confirm, "teaching:leave:confirm", False, id="leave_teacher_confirm"),
+        ],
+    )
+    @pytest.mark.parametrize(
+        "message",
+        [pytest.param(None, id="no_message"), pytest.param(NOT_A_MESSAGE, id="not_message_type")],
+    )
+    async def test_early_return_without_message(
+        self,
+        handler: Callable[..., Awaitable[None]],
+        data: str,
+        takes_state: bool,  # noqa: FBT001
+        message: object,
         mock_callback: MagicMock,
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_state: MagicMock,
     ) -> None:
-        """Handler returns early when callback has no message."""
-        mock_callback.message = None
+        """Handler returns early when the callback has no Message."""
+        mock_callback.data = data
+        mock_callback.message = message
+        args = (mock_callback, mock_i18n, db_user, mock_state) if takes_state else (mock_callback, mock_i18n, db_user)
 
-        await on_role_selection(mock_callback, mock_i18n, db_user, mock_state)
+        await handler(*args)
 
         mock_callback.answer.assert_not_called()
+        mock_state.set_state.assert_not_called()
+        mock_state.clear.assert_not_called()
 
-    async def test_returns_early_when_message_not_message_type(
+    async def test_remove_student_confirm_returns_early_without_message(
         self,
         mock_callback: MagicMock,
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
-        mock_state: MagicMock,
     ) -> None:
-        """Handler returns early when message is not Message type."""
-        mock_callback.message = MagicMock()
+        """Confirmation handler returns early when the callback has no message."""
+        mock_callback.message = None
+        mock_callback.data = "teaching:remove:confirm:abc"
 
-        await on_role_selection(mock_callback, mock_i18n, db_user, mock_state)
+        await on_remove_student_confirm(mock_callback, mock_i18n, db_user)
 
         mock_callback.answer.assert_not_called()
 
+
+class TestOnRoleSelection:
+    """Tests for on_role_selection handler."""
+
     async def test_shows_role_selection(
         self,
         mock_callback: MagicMock,
@@ -66,181 +134,91 @@ class TestOnRoleSelection:
         db_user: UserReadDTO,
         mock_state: MagicMock,
         mock_message: MagicMock,
+        handler_mocks: SimpleNamespace,
     ) -> None:
         """Handler shows role selection screen."""
         mock_callback.message = mock_message
 
-        with patch("src.bot.handlers.teaching.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
+        handler_mocks.service.is_teacher.return_value = False
+        handler_mocks.service.is_student.return_value = False
 
-            with patch("src.bot.handlers.teaching.TeachingService") as mock_service_class:
-                mock_service = mock_service_class.return_value
-                mock_service.is_teacher = AsyncMock(return_value=False)
-                mock_service.is_student = AsyncMock(return_value=False)
-
-                with patch("src.bot.handlers.teaching.safe_edit_or_send", new_callable=AsyncMock) as mock_safe_edit:
-                    await on_role_selection(mock_callback, mock_i18n, db_user, mock_state)
+        await on_role_selection(mock_callback, mock_i18n, db_user, mock_state)
 
         mock_state.clear.assert_called_once()
-        mock_safe_edit.assert_called_once()
+        handler_mocks.safe_edit.assert_called_once()
         mock_callback.answer.assert_called_once()
 
 
 class TestOnBecomeTeacher:
     """Tests for on_become_teacher handler."""
 
-    async def test_returns_early_when_no_message(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        db_user: UserReadDTO,
-    ) -> None:
-        """Handler returns early when callback has no message."""
-        mock_callback.message = None
-
-        await on_become_teacher(mock_callback, mock_i18n, db_user)
-
-        mock_callback.answer.assert_not_called()
-
-    async def test_returns_early_when_message_not_message_type(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        db_user: UserReadDTO,
-    ) -> None:
-        """Handler returns early when message is not Message type."""
-        mock_callback.message = MagicMock()
-
-        await on_become_teacher(mock_callback, mock_i18n, db_user)
-
-        mock_callback.answer.assert_not_called()
-
     async def test_becomes_teacher_and_shows_invite(
         self,
         mock_callback: MagicMock,
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_message: MagicMock,
+        handler_mocks: SimpleNamespace,
     ) -> None:
         """Handler creates invite and shows it."""
         mock_callback.message = mock_message
 
-        with patch("src.bot.handlers.teaching.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-            with patch("src.bot.handlers.teaching.TeachingService") as mock_service_class:
-                mock_service = mock_service_class.return_value
-                mock_service.become_teacher = AsyncMock(
-                    return_value=InviteCodeDTO(
-                        code="ABC123DEF456", deep_link="https://t.me/bot?start=join_ABC123DEF456"
-                    ),
-                )
+        handler_mocks.service.become_teacher.return_value = InviteCodeDTO(
+            code="ABC123DEF456", deep_link="https://t.me/bot?start=join_ABC123DEF456"
+        )
 
-                with patch("src.bot.handlers.teaching.safe_edit_or_send", new_callable=AsyncMock) as mock_safe_edit:
-                    await on_become_teacher(mock_callback, mock_i18n, db_user)
+        await on_become_teacher(mock_callback, mock_i18n, db_user)
 
-        mock_session.commit.assert_called_once()
-        mock_safe_edit.assert_called_once()
+        assert handler_mocks.session.commit.call_count == 1
+        handler_mocks.safe_edit.assert_called_once()
         mock_callback.answer.assert_called_once()
 
 
 class TestOnTeacherDashboard:
     """Tests for on_teacher_dashboard handler."""
 
-    async def test_returns_early_when_no_message(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        db_user: UserReadDTO,
-    ) -> None:
-        """Handler returns early when callback has no message."""
-        mock_callback.message = None
-
-        await on_teacher_dashboard(mock_callback, mock_i18n, db_user)
-
-        mock_callback.answer.assert_not_called()
-
-    async def test_returns_early_when_message_not_message_type(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        db_user: UserReadDTO,
-    ) -> None:
-        """Handler returns early when message is not Message type."""
-        mock_callback.message = MagicMock()
-
-        await on_teacher_dashboard(mock_callback, mock_i18n, db_user)
-
-        mock_callback.answer.assert_not_called()
-
     async def test_shows_dashboard_with_stats(
         self,
         mock_callback: MagicMock,
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_message: MagicMock,
+        handler_mocks: SimpleNamespace,
     ) -> None:
         """Handler shows dashboard with stats."""
         mock_callback.message = mock_message
 
-        with patch("src.bot.handlers.teaching.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-            with patch("src.bot.handlers.teaching.TeachingService") as mock_service_class:
-                mock_service = mock_service_class.return_value
-                mock_service.get_teacher_dashboard_stats = AsyncMock(
-                    return_value=TeacherDashboardStatsDTO(students_count=5, active_assignments_count=2),
-                )
+        handler_mocks.service.get_teacher_dashboard_stats.return_value = TeacherDashboardStatsDTO(
+            students_count=5, active_assignments_count=2
+        )
 
-                with patch("src.bot.handlers.teaching.safe_edit_or_send", new_callable=AsyncMock) as mock_safe_edit:
-                    await on_teacher_dashboard(mock_callback, mock_i18n, db_user)
+        await on_teacher_dashboard(mock_callback, mock_i18n, db_user)
 
-        mock_safe_edit.assert_called_once()
+        handler_mocks.safe_edit.assert_called_once()
         mock_callback.answer.assert_called_once()
 
 
 class TestOnStudentList:
     """Tests for on_student_list handler."""
 
-    async def test_returns_early_when_no_message(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        db_user: UserReadDTO,
-    ) -> None:
-        """Handler returns early when callback has no message."""
-        mock_callback.message = None
-
-        await on_student_list(mock_callback, mock_i18n, db_user)
-
-        mock_callback.answer.assert_not_called()
-
     async def test_shows_empty_student_list(
         self,
         mock_callback: MagicMock,
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_message: MagicMock,
+        record_i18n: I18nRecorder,
+        handler_mocks: SimpleNamespace,
     ) -> None:
         """Handler shows empty message when no students."""
         mock_callback.message = mock_message
 
-        with patch("src.bot.handlers.teaching.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-            with patch("src.bot.handlers.teaching.TeachingService") as mock_service_class:
-                mock_service = mock_service_class.return_value
-                mock_service.get_students = AsyncMock(return_value=[])
+        handler_mocks.service.get_students.return_value = []
 
-                with patch("src.bot.handlers.teaching.safe_edit_or_send", new_callable=AsyncMock) as mock_safe_edit:
-                    await on_student_list(mock_callback, mock_i18n, db_user)
+        await on_student_list(mock_callback, mock_i18n, db_user)
 
-        mock_i18n.get.assert_any_call("teaching-no-students")
-        mock_safe_edit.assert_called_once()
+        assert "teaching-no-students" in record_i18n.keys
+        handler_mocks.safe_edit.assert_called_once()
         mock_callback.answer.assert_called_once()
 
     async def test_shows_student_list_with_students(
@@ -249,50 +227,22 @@ class TestOnStudentList:
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_message: MagicMock,
+        handler_mocks: SimpleNamespace,
     ) -> None:
         """Handler shows student list when students exist."""
         mock_callback.message = mock_message
 
-        mock_student = TeacherStudentWithUserDTO(
-            id=uuid4(),
-            user_id=uuid4(),
-            username="student1",
-            first_name="Student",
-            status=TeacherStudentStatus.ACTIVE,
-        )
-
-        with patch("src.bot.handlers.teaching.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
+        handler_mocks.service.get_students.return_value = [_STUDENT]
 
-            with patch("src.bot.handlers.teaching.TeachingService") as mock_service_class:
-                mock_service = mock_service_class.return_value
-                mock_service.get_students = AsyncMock(return_value=[mock_student])
-
-                with patch("src.bot.handlers.teaching.safe_edit_or_send", new_callable=AsyncMock) as mock_safe_edit:
-                    await on_student_list(mock_callback, mock_i18n, db_user)
+        await on_student_list(mock_callback, mock_i18n, db_user)
 
-        mock_safe_edit.assert_called_once()
+        handler_mocks.safe_edit.assert_called_once()
         mock_callback.answer.assert_called_once()
 
 
 class TestOnStudentDetail:
     """Tests for on_student_detail handler."""
 
-    async def test_returns_early_when_no_message(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        db_user: UserReadDTO,
-    ) -> None:
-        """Handler returns early when callback has no message."""
-        mock_callback.message = None
-        mock_callback.data = "teaching:student:abc"
-
-        await on_student_detail(mock_callback, mock_i18n, db_user)
-
-        mock_callback.answer.assert_not_called()
-
     async def test_returns_early_when_no_data(
         self,
         mock_callback: MagicMock,
@@ -308,20 +258,6 @@ class TestOnStudentDetail:
 
         mock_callback.answer.assert_not_called()
 
-    async def test_returns_early_when_message_not_message_type(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        db_user: UserReadDTO,
-    ) -> None:
-        """Handler returns early when message is not Message type."""
-        mock_callback.message = MagicMock()  # Not a Message instance
-        mock_callback.data = "teaching:student:123"
-
-        await on_student_detail(mock_callback, mock_i18n, db_user)
-
-        mock_callback.answer.assert_not_called()
-
     async def test_shows_error_on_invalid_uuid(
         self,
         mock_callback: MagicMock,
@@ -336,8 +272,7 @@ class TestOnStudentDetail:
         await on_student_detail(mock_callback, mock_i18n, db_user)
 
         mock_callback.answer.assert_called_once()
-        call_kwargs = mock_callback.answer.call_args.kwargs
-        assert call_kwargs.get("show_alert") is True
+        assert mock_callback.answer.call_args.kwargs["show_alert"] is True
 
     async def test_shows_error_when_student_not_found(
         self,
@@ -345,25 +280,18 @@ class TestOnStudentDetail:
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_message: MagicMock,
+        handler_mocks: SimpleNamespace,
     ) -> None:
         """Handler shows error when student not found."""
-        student_id = uuid4()
         mock_callback.message = mock_message
-        mock_callback.data = f"teaching:student:{student_id}"
-
-        with patch("src.bot.handlers.teaching.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
+        mock_callback.data = _CB_STUDENT_DETAIL
 
-            with patch("src.bot.handlers.teaching.TeachingService") as mock_service_class:
-                mock_service = mock_service_class.return_value
-                mock_service.get_students = AsyncMock(return_value=[])
+        handler_mocks.service.get_students.return_value = []
 
-                await on_student_detail(mock_callback, mock_i18n, db_user)
+        await on_student_detail(mock_callback, mock_i18n, db_user)
 
         mock_callback.answer.assert_called_once()
-        call_kwargs = mock_callback.answer.call_args.kwargs
-        assert call_kwargs.get("show_alert") is True
+        assert mock_callback.answer.call_args.kwargs["show_alert"] is True
 
     async def test_shows_student_detail_when_found(
         self,
@@ -371,32 +299,17 @@ class TestOnStudentDetail:
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_message: MagicMock,
+        handler_mocks: SimpleNamespace,
     ) -> None:
         """Handler shows student detail when student is found."""
-        student_id = uuid4()
         mock_callback.message = mock_message
-        mock_callback.data = f"teaching:student:{student_id}"
-
-        mock_student = TeacherStudentWithUserDTO(
-            id=uuid4(),
-            user_id=student_id,
-            username="student1",
-            first_name="Student One",
-            status=TeacherStudentStatus.ACTIVE,
-        )
+        mock_callback.data = _CB_STUDENT_DETAIL
 
-        with patch("src.bot.handlers.teaching.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
+        handler_mocks.service.get_students.return_value = [_STUDENT]
 
-            with patch("src.bot.handlers.teaching.TeachingService") as mock_service_class:
-                mock_service = mock_service_class.return_value
-                mock_service.get_students = AsyncMock(return_value=[mock_student])
-
-                with patch("src.bot.handlers.teaching.safe_edit_or_send", new_callable=AsyncMock) as mock_safe_edit:
-                    await on_student_detail(mock_callback, mock_i18n, db_user)
+        await on_student_detail(mock_callback, mock_i18n, db_user)
 
-        mock_safe_edit.assert_called_once()
+        handler_mocks.safe_edit.assert_called_once()
         mock_callback.answer.assert_called_once()
 
 
@@ -409,23 +322,17 @@ class TestOnStudentListPage:
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_message: MagicMock,
+        handler_mocks: SimpleNamespace,
     ) -> None:
         """Handler parses page number from callback data."""
         mock_callback.message = mock_message
         mock_callback.data = "teaching:students:2"
 
-        with patch("src.bot.handlers.teaching.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
+        handler_mocks.service.get_students.return_value = []
 
-            with patch("src.bot.handlers.teaching.TeachingService") as mock_service_class:
-                mock_service = mock_service_class.return_value
-                mock_service.get_students = AsyncMock(return_value=[])
+        await on_student_list_page(mock_callback, mock_i18n, db_user)
 
-                with patch("src.bot.handlers.teaching.safe_edit_or_send", new_callable=AsyncMock) as mock_safe_edit:
-                    await on_student_list_page(mock_callback, mock_i18n, db_user)
-
-        mock_safe_edit.assert_called_once()
+        handler_mocks.safe_edit.assert_called_once()
         mock_callback.answer.assert_called_once()
 
     async def test_defaults_to_page_zero_when_no_data(
@@ -434,57 +341,23 @@ class TestOnStudentListPage:
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_message: MagicMock,
+        handler_mocks: SimpleNamespace,
     ) -> None:
         """Handler defaults to page 0 when callback.data is None."""
         mock_callback.message = mock_message
         mock_callback.data = None
 
-        with patch("src.bot.handlers.teaching.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-            with patch("src.bot.handlers.teaching.TeachingService") as mock_service_class:
-                mock_service = mock_service_class.return_value
-                mock_service.get_students = AsyncMock(return_value=[])
+        handler_mocks.service.get_students.return_value = []
 
-                with patch("src.bot.handlers.teaching.safe_edit_or_send", new_callable=AsyncMock) as mock_safe_edit:
-                    await on_student_list_page(mock_callback, mock_i18n, db_user)
+        await on_student_list_page(mock_callback, mock_i18n, db_user)
 
-        mock_safe_edit.assert_called_once()
+        handler_mocks.safe_edit.assert_called_once()
         mock_callback.answer.assert_called_once()
 
 
 class TestOnRemoveStudent:
     """Tests for on_remove_student handler."""
 
-    async def test_returns_early_when_no_message(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        db_user: UserReadDTO,
-    ) -> None:
-        """Handler returns early when callback has no message."""
-        mock_callback.message = None
-        mock_callback.data = "teaching:remove:abc"
-
-        await on_remove_student(mock_callback, mock_i18n, db_user)
-
-        mock_callback.answer.assert_not_called()
-
-    async def test_returns_early_when_message_not_message_type(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        db_user: UserReadDTO,
-    ) -> None:
-        """Handler returns early when message is not Message type."""
-        mock_callback.message = MagicMock()  # Not a Message instance
-        mock_callback.data = "teaching:remove:123"
-
-        await on_remove_student(mock_callback, mock_i18n, db_user)
-
-        mock_callback.answer.assert_not_called()
-
     async def test_shows_error_on_invalid_uuid(
         self,
         mock_callback: MagicMock,
@@ -499,8 +372,7 @@ class TestOnRemoveStudent:
         await on_remove_student(mock_callback, mock_i18n, db_user)
 
         mock_callback.answer.assert_called_once()
-        call_kwargs = mock_callback.answer.call_args.kwargs
-        assert call_kwargs.get("show_alert") is True
+        assert mock_callback.answer.call_args.kwargs["show_alert"] is True
 
     async def test_shows_confirmation(
         self,
@@ -508,37 +380,23 @@ class TestOnRemoveStudent:
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_message: MagicMock,
+        record_i18n: I18nRecorder,
+        handler_mocks: SimpleNamespace,
     ) -> None:
         """Handler shows removal confirmation."""
-        student_id = uuid4()
         mock_callback.message = mock_message
-        mock_callback.data = f"teaching:remove:{student_id}"
+        mock_callback.data = _CB_REMOVE
 
-        with patch("src.bot.handlers.teaching.safe_edit_or_send", new_callable=AsyncMock) as mock_safe_edit:
-            await on_remove_student(mock_callback, mock_i18n, db_user)
+        await on_remove_student(mock_callback, mock_i18n, db_user)
 
-        mock_i18n.get.assert_any_call("teaching-remove-confirm")
-        mock_safe_edit.assert_called_once()
+        assert "teaching-remove-confirm" in record_i18n.keys
+        handler_mocks.safe_edit.assert_called_once()
         mock_callback.answer.assert_called_once()
 
 
 class TestOnRemoveStudentConfirm:
     """Tests for on_remove_student_confirm handler."""
 
-    async def test_returns_early_when_no_message(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        db_user: UserReadDTO,
-    ) -> None:
-        """Handler returns early when callback has no message."""
-        mock_callback.message = None
-        mock_callback.data = "teaching:remove:confirm:abc"
-
-        await on_remove_student_confirm(mock_callback, mock_i18n, db_user)
-
-        mock_callback.answer.assert_not_called()
-
     async def test_shows_error_on_invalid_uuid(
         self,
         mock_callback: MagicMock,
@@ -553,8 +411,7 @@ class TestOnRemoveStudentConfirm:
         await on_remove_student_confirm(mock_callback, mock_i18n, db_user)
 
         mock_callback.answer.assert_called_once()
-        call_kwargs = mock_callback.answer.call_args.kwargs
-        assert call_kwargs.get("show_alert") is True
+        assert mock_callback.answer.call_args.kwargs["show_alert"] is True
 
     async def test_removes_student_successfully(
         self,
@@ -562,26 +419,18 @@ class TestOnRemoveStudentConfirm:
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_message: MagicMock,
+        handler_mocks: SimpleNamespace,
     ) -> None:
         """Handler removes student and redirects."""
-        student_id = uuid4()
         mock_callback.message = mock_message
-        mock_callback.data = f"teaching:remove:confirm:{student_id}"
+        mock_callback.data = _CB_REMOVE_CONFIRM
 
-        with patch("src.bot.handlers.teaching.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
+        handler_mocks.service.get_students.return_value = []
 
-            with patch("src.bot.handlers.teaching.TeachingService") as mock_service_class:
-                mock_service = mock_service_class.return_value
-                mock_service.remove_student = AsyncMock()
-                mock_service.get_students = AsyncMock(return_value=[])
-
-                with patch("src.bot.handlers.teaching.safe_edit_or_send", new_callable=AsyncMock):
-                    await on_remove_student_confirm(mock_callback, mock_i18n, db_user)
+        await on_remove_student_confirm(mock_callback, mock_i18n, db_user)
 
-        mock_service.remove_student.assert_called_once()
-        mock_session.commit.assert_called_once()
+        handler_mocks.service.remove_student.assert_called_once()
+        assert handler_mocks.session.commit.call_count == 1
 
     async def test_shows_error_when_not_found(
         self,
@@ -589,172 +438,71 @@ class TestOnRemoveStudentConfirm:
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_message: MagicMock,
+        handler_mocks: SimpleNamespace,
     ) -> None:
         """Handler shows error when student not found."""
-        student_id = uuid4()
         mock_callback.message = mock_message
-        mock_callback.data = f"teaching:remove:confirm:{student_id}"
+        mock_callback.data = _CB_REMOVE_CONFIRM
 
-        with patch("src.bot.handlers.teaching.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
+        handler_mocks.service.remove_student.side_effect = NotFoundError()
 
-            with patch("src.bot.handlers.teaching.TeachingService") as mock_service_class:
-                mock_service = mock_service_class.return_value
-                mock_service.remove_student = AsyncMock(side_effect=NotFoundError())
-
-                await on_remove_student_confirm(mock_callback, mock_i18n, db_user)
+        await on_remove_student_confirm(mock_callback, mock_i18n, db_user)
 
         mock_callback.answer.assert_called_once()
-        call_kwargs = mock_callback.answer.call_args.kwargs
-        assert call_kwargs.get("show_alert") is True
+        assert mock_callback.answer.call_args.kwargs["show_alert"] is True
 
 
 class TestOnShowInvite:
     """Tests for on_show_invite handler."""
 
-    async def test_returns_early_when_no_message(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        db_user: UserReadDTO,
-    ) -> None:
-        """Handler returns early when callback has no message."""
-        mock_callback.message = None
-
-        await on_show_invite(mock_callback, mock_i18n, db_user)
-
-        mock_callback.answer.assert_not_called()
-
-    async def test_returns_early_when_message_not_message_type(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        db_user: UserReadDTO,
-    ) -> None:
-        """Handler returns early when message is not Message type."""
-        mock_callback.message = MagicMock()  # Not a Message instance
-
-        await on_show_invite(mock_callback, mock_i18n, db_user)
-
-        mock_callback.answer.assert_not_called()
-
     async def test_shows_invite_code(
         self,
         mock_callback: MagicMock,
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_message: MagicMock,
+        handler_mocks: SimpleNamespace,
     ) -> None:
         """Handler shows invite code."""
         mock_callback.message = mock_message
 
-        with patch("src.bot.handlers.teaching.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-            with patch("src.bot.handlers.teaching.TeachingService") as mock_service_class:
-                mock_service = mock_service_class.return_value
-                mock_service.become_teacher = AsyncMock(
-                    return_value=InviteCodeDTO(code="XYZ789", deep_link="https://t.me/bot"),
-                )
+        handler_mocks.service.become_teacher.return_value = InviteCodeDTO(code="XYZ789", deep_link="https://t.me/bot")
 
-                with patch("src.bot.handlers.teaching.safe_edit_or_send", new_callable=AsyncMock) as mock_safe_edit:
-                    await on_show_invite(mock_callback, mock_i18n, db_user)
+        await on_show_invite(mock_callback, mock_i18n, db_user)
 
-        mock_safe_edit.assert_called_once()
+        handler_mocks.safe_edit.assert_called_once()
         mock_callback.answer.assert_called_once()
 
 
 class TestOnRegenerateInvite:
     """Tests for on_regenerate_invite handler."""
 
-    async def test_returns_early_when_no_message(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        db_user: UserReadDTO,
-    ) -> None:
-        """Handler returns early when callback has no message."""
-        mock_callback.message = None
-
-        await on_regenerate_invite(mock_callback, mock_i18n, db_user)
-
-        mock_callback.answer.assert_not_called()
-
-    async def test_returns_early_when_message_not_message_type(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        db_user: UserReadDTO,
-    ) -> None:
-        """Handler returns early when message is not Message type."""
-        mock_callback.message = MagicMock()  # Not a Message instance
-
-        await on_regenerate_invite(mock_callback, mock_i18n, db_user)
-
-        mock_callback.answer.assert_not_called()
-
     async def test_regenerates_and_shows_new_code(
         self,
         mock_callback: MagicMock,
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_message: MagicMock,
+        handler_mocks: SimpleNamespace,
     ) -> None:
         """Handler regenerates code and shows it."""
         mock_callback.message = mock_message
 
-        with patch("src.bot.handlers.teaching.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-            with patch("src.bot.handlers.teaching.TeachingService") as mock_service_class:
-                mock_service = mock_service_class.return_value
-                mock_service.regenerate_invite_code = AsyncMock(
-                    return_value=InviteCodeDTO(code="NEW123", deep_link="https://t.me/bot"),
-                )
+        handler_mocks.service.regenerate_invite_code.return_value = InviteCodeDTO(
+            code="NEW123", deep_link="https://t.me/bot"
+        )
 
-                with patch("src.bot.handlers.teaching.safe_edit_or_send", new_callable=AsyncMock) as mock_safe_edit:
-                    await on_regenerate_invite(mock_callback, mock_i18n, db_user)
+        await on_regenerate_invite(mock_callback, mock_i18n, db_user)
 
-        mock_service.regenerate_invite_code.assert_called_once()
-        mock_session.commit.assert_called_once()
-        mock_safe_edit.assert_called_once()
+        handler_mocks.service.regenerate_invite_code.assert_called_once()
+        assert handler_mocks.session.commit.call_count == 1
+        handler_mocks.safe_edit.assert_called_once()
         mock_callback.answer.assert_called_once()
 
 
 class TestOnJoinTeacherPrompt:
     """Tests for on_join_teacher_prompt handler."""
 
-    async def test_returns_early_when_no_message(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        db_user: UserReadDTO,
-        mock_state: MagicMock,
-    ) -> None:
-        """Handler returns early when callback has no message."""
-        mock_callback.message = None
-
-        await on_join_teacher_prompt(mock_callback, mock_i18n, db_user, mock_state)
-
-        mock_callback.answer.assert_not_called()
-
-    async def test_returns_early_when_message_not_message_type(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        db_user: UserReadDTO,
-        mock_state: MagicMock,
-    ) -> None:
-        """Handler returns early when message is not Message type."""
-        mock_callback.message = MagicMock()  # Not a Message instance
-
-        await on_join_teacher_prompt(mock_callback, mock_i18n, db_user, mock_state)
-
-        mock_callback.answer.assert_not_called()
-
     async def test_sets_state_and_shows_prompt(
         self,
         mock_callback: MagicMock,
@@ -762,16 +510,17 @@ class TestOnJoinTeacherPrompt:
         db_user: UserReadDTO,
         mock_state: MagicMock,
         mock_message: MagicMock,
+        record_i18n: I18nRecorder,
+        handler_mocks: SimpleNamespace,
     ) -> None:
         """Handler sets FSM state and shows prompt."""
         mock_callback.message = mock_message
 
-        with patch("src.bot.handlers.teaching.safe_edit_or_send", new_callable=AsyncMock) as mock_safe_edit:
-            await on_join_teacher_prompt(mock_callback, mock_i18n, db_user, mock_state)
+        await on_join_teacher_prompt(mock_callback, mock_i18n, db_user, mock_state)
 
         mock_state.set_state.assert_called_once()
-        mock_i18n.get.assert_any_call("teaching-join-prompt")
-        mock_safe_edit.assert_called_once()
+        assert "teaching-join-prompt" in record_i18n.keys
+        handler_mocks.safe_edit.assert_called_once()
         mock_callback.answer.assert_called_once()
 
 
@@ -798,31 +547,17 @@ class TestOnInviteCodeInput:
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_state: MagicMock,
+        handler_mocks: SimpleNamespace,
     ) -> None:
         """Handler joins teacher on valid code."""
         mock_message.text = "ABC123DEF456"
 
-        mock_teacher = TeacherStudentWithUserDTO(
-            id=uuid4(),
-            user_id=uuid4(),
-            username="teacher1",
-            first_name="Teacher",
-            status=TeacherStudentStatus.ACTIVE,
-        )
+        handler_mocks.service.get_teacher.return_value = _TEACHER
 
-        with patch("src.bot.handlers.teaching.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-            with patch("src.bot.handlers.teaching.TeachingService") as mock_service_class:
-                mock_service = mock_service_class.return_value
-                mock_service.join_teacher = AsyncMock()
-                mock_service.get_teacher = AsyncMock(return_value=mock_teacher)
-
-                await on_invite_code_input(mock_message, mock_i18n, db_user, mock_state)
+        await on_invite_code_input(mock_message, mock_i18n, db_user, mock_state)
 
         mock_state.clear.assert_called_once()
-        mock_session.commit.assert_called_once()
+        assert handler_mocks.session.commit.call_count == 1
         mock_message.answer.assert_called_once()
 
     async def test_shows_error_on_invalid_code(
@@ -831,21 +566,17 @@ class TestOnInviteCodeInput:
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_state: MagicMock,
+        record_i18n: I18nRecorder,
+        handler_mocks: SimpleNamespace,
     ) -> None:
         """Handler shows error on invalid code."""
         mock_message.text = "INVALID"
 
-        with patch("src.bot.handlers.teaching.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-            with patch("src.bot.handlers.teaching.TeachingService") as mock_service_class:
-                mock_service = mock_service_class.return_value
-                mock_service.join_teacher = AsyncMock(side_effect=NotFoundError())
+        handler_mocks.service.join_teacher.side_effect = NotFoundError()
 
-                await on_invite_code_input(mock_message, mock_i18n, db_user, mock_state)
+        await on_invite_code_input(mock_message, mock_i18n, db_user, mock_state)
 
-        mock_i18n.get.assert_any_call("teaching-join-invalid")
+        assert "teaching-join-invalid" in record_i18n.keys
         mock_message.answer.assert_called_once()
         mock_state.clear.assert_not_called()
 
@@ -855,21 +586,17 @@ class TestOnInviteCodeInput:
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_state: MagicMock,
+        record_i18n: I18nRecorder,
+        handler_mocks: SimpleNamespace,
     ) -> None:
         """Handler shows error when trying to join self."""
         mock_message.text = "SELFCODE"
 
-        with patch("src.bot.handlers.teaching.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-            with patch("src.bot.handlers.teaching.TeachingService") as mock_service_class:
-                mock_service = mock_service_class.return_value
-                mock_service.join_teacher = AsyncMock(side_effect=ValidationError())
+        handler_mocks.service.join_teacher.side_effect = ValidationError()
 
-                await on_invite_code_input(mock_message, mock_i18n, db_user, mock_state)
+        await on_invite_code_input(mock_message, mock_i18n, db_user, mock_state)
 
-        mock_i18n.get.assert_any_call("teaching-join-self")
+        assert "teaching-join-self" in record_i18n.keys
         mock_state.clear.assert_not_called()
 
     async def test_shows_error_on_already_joined(
@@ -878,76 +605,41 @@ class TestOnInviteCodeInput:
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_state: MagicMock,
+        record_i18n: I18nRecorder,
+        handler_mocks: SimpleNamespace,
     ) -> None:
         """Handler shows error when already joined."""
         mock_message.text = "DUPLICATE"
 
-        with patch("src.bot.handlers.teaching.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
+        handler_mocks.service.join_teacher.side_effect = ConflictError()
 
-            with patch("src.bot.handlers.teaching.TeachingService") as mock_service_class:
-                mock_service = mock_service_class.return_value
-                mock_service.join_teacher = AsyncMock(side_effect=ConflictError())
-
-                await on_invite_code_input(mock_message, mock_i18n, db_user, mock_state)
+        await on_invite_code_input(mock_message, mock_i18n, db_user, mock_state)
 
-        mock_i18n.get.assert_any_call("teaching-join-already")
+        assert "teaching-join-already" in record_i18n.keys
         mock_state.clear.assert_not_called()
 
 
 class TestOnStudentPanel:
     """Tests for on_student_panel handler."""
 
-    async def test_returns_early_when_no_message(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        db_user: UserReadDTO,
-    ) -> None:
-        """Handler returns early when callback has no message."""
-        mock_callback.message = None
-
-        await on_student_panel(mock_callback, mock_i18n, db_user)
-
-        mock_callback.answer.assert_not_called()
-
-    async def test_returns_early_when_message_not_message_type(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        db_user: UserReadDTO,
-    ) -> None:
-        """Handler returns early when message is not Message type."""
-        mock_callback.message = MagicMock()  # Not a Message instance
-
-        await on_student_panel(mock_callback, mock_i18n, db_user)
-
-        mock_callback.answer.assert_not_called()
-
     async def test_shows_no_teacher_message(
         self,
         mock_callback: MagicMock,
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_message: MagicMock,
+        record_i18n: I18nRecorder,
+        handler_mocks: SimpleNamespace,
     ) -> None:
         """Handler shows message when no teacher."""
         mock_callback.message = mock_message
 
-        with patch("src.bot.handlers.teaching.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-            with patch("src.bot.handlers.teaching.TeachingService") as mock_service_class:
-                mock_service = mock_service_class.return_value
-                mock_service.get_teacher = AsyncMock(return_value=None)
+        handler_mocks.service.get_teacher.return_value = None
 
-                with patch("src.bot.handlers.teaching.safe_edit_or_send", new_callable=AsyncMock) as mock_safe_edit:
-                    await on_student_panel(mock_callback, mock_i18n, db_user)
+        await on_student_panel(mock_callback, mock_i18n, db_user)
 
-        mock_i18n.get.assert_any_call("teaching-no-teacher")
-        mock_safe_edit.assert_called_once()
+        assert "teaching-no-teacher" in record_i18n.keys
+        handler_mocks.safe_edit.assert_called_once()
         mock_callback.answer.assert_called_once()
 
     async def test_shows_teacher_info(
@@ -956,131 +648,64 @@ class TestOnStudentPanel:
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_message: MagicMock,
+        handler_mocks: SimpleNamespace,
     ) -> None:
         """Handler shows teacher info when exists."""
         mock_callback.message = mock_message
 
-        mock_teacher = TeacherStudentWithUserDTO(
-            id=uuid4(),
-            user_id=uuid4(),
-            username="teacher1",
-            first_name="Teacher",
-            status=TeacherStudentStatus.ACTIVE,
-        )
+        handler_mocks.service.get_teacher.return_value = _TEACHER
 
-        with patch("src.bot.handlers.teaching.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-            with patch("src.bot.handlers.teaching.TeachingService") as mock_service_class:
-                mock_service = mock_service_class.return_value
-                mock_service.get_teacher = AsyncMock(return_value=mock_teacher)
-
-                with patch("src.bot.handlers.teaching.safe_edit_or_send", new_callable=AsyncMock) as mock_safe_edit:
-                    await on_student_panel(mock_callback, mock_i18n, db_user)
+        await on_student_panel(mock_callback, mock_i18n, db_user)
 
-        mock_safe_edit.assert_called_once()
+        handler_mocks.safe_edit.assert_called_once()
         mock_callback.answer.assert_called_once()
 
 
 class TestOnLeaveTeacher:
     """Tests for on_leave_teacher handler."""
 
-    async def test_returns_early_when_no_message(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        db_user: UserReadDTO,
-    ) -> None:
-        """Handler returns early when callback has no message."""
-        mock_callback.message = None
-
-        await on_leave_teacher(mock_callback, mock_i18n, db_user)
-
-        mock_callback.answer.assert_not_called()
-
-    async def test_returns_early_when_message_not_message_type(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        db_user: UserReadDTO,
-    ) -> None:
-        """Handler returns early when message is not Message type."""
-        mock_callback.message = MagicMock()  # Not a Message instance
-
-        await on_leave_teacher(mock_callback, mock_i18n, db_user)
-
-        mock_callback.answer.assert_not_called()
-
     async def test_shows_confirmation(
         self,
         mock_callback: MagicMock,
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_message: MagicMock,
+        record_i18n: I18nRecorder,
+        handler_mocks: SimpleNamespace,
     ) -> None:
         """Handler shows leave confirmation."""
         mock_callback.message = mock_message
 
-        with patch("src.bot.handlers.teaching.safe_edit_or_send", new_callable=AsyncMock) as mock_safe_edit:
-            await on_leave_teacher(mock_callback, mock_i18n, db_user)
+        await on_leave_teacher(mock_callback, mock_i18n, db_user)
 
-        mock_i18n.get.assert_any_call("teaching-leave-confirm")
-        mock_safe_edit.assert_called_once()
+        assert "teaching-leave-confirm" in record_i18n.keys
+        handler_mocks.safe_edit.assert_called_once()
         mock_callback.answer.assert_called_once()
 
 
 class TestOnLeaveTeacherConfirm:
     """Tests for on_leave_teacher_confirm handler."""
 
-    async def test_returns_early_when_no_message(
-        self,
-        mock_callback: MagicMock,
-        mock_i18n: MagicMock,
-        db_user: UserReadDTO,
-    ) -> None:
-        """Handler returns early when callback has no message."""
-        mock_callback.message = None
-
-        await on_leave_teacher_confirm(mock_callback, mock_i18n, db_user)
-
-        mock_callback.answer.assert_not_called()
-
     async def test_leaves_teacher_and_redirects(
         self,
         mock_callback: MagicMock,
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_message: MagicMock,
+        handler_mocks: SimpleNamespace,
     ) -> None:
         """Handler leaves teacher and redirects to role selection."""
         mock_callback.message = mock_message
 
-        mock_teacher = TeacherStudentWithUserDTO(
-            id=uuid4(),
-            user_id=uuid4(),
-            username="teacher1",
-            first_name="Teacher",
-            status=TeacherStudentStatus.ACTIVE,
-        )
-
-        with patch("src.bot.handlers.teaching.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-            with patch("src.bot.handlers.teaching.TeachingService") as mock_service_class:
-                mock_service = mock_service_class.return_value
-                mock_service.get_teacher = AsyncMock(return_value=mock_teacher)
-                mock_service.leave_teacher = AsyncMock()
-                mock_service.is_teacher = AsyncMock(return_value=False)
-                mock_service.is_student = AsyncMock(return_value=False)
+        handler_mocks.service.get_teacher.return_value = _TEACHER
+        handler_mocks.service.is_teacher.return_value = False
+        handler_mocks.service.is_student.return_value = False
 
-                with patch("src.bot.handlers.teaching.safe_edit_or_send", new_callable=AsyncMock) as mock_safe_edit:
-                    await on_leave_teacher_confirm(mock_callback, mock_i18n, db_user)
+        await on_leave_teacher_confirm(mock_callback, mock_i18n, db_user)
 
-        mock_service.leave_teacher.assert_called_once()
-        mock_session.commit.assert_called_once()
-        mock_safe_edit.assert_called_once()
+        handler_mocks.service.leave_teacher.assert_called_once()
+        assert handler_mocks.session.commit.call_count == 1
+        handler_mocks.safe_edit.assert_called_once()
         mock_callback.answer.assert_called_once()
 
 
@@ -1105,29 +730,15 @@ class TestHandleDeepLinkJoin:
         mock_message: MagicMock,
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
+        handler_mocks: SimpleNamespace,
     ) -> None:
         """Helper joins teacher successfully."""
-        mock_teacher = TeacherStudentWithUserDTO(
-            id=uuid4(),
-            user_id=uuid4(),
-            username="teacher1",
-            first_name="Teacher",
-            status=TeacherStudentStatus.ACTIVE,
-        )
-
-        with patch("src.bot.handlers.teaching.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
+        handler_mocks.service.get_teacher.return_value = _TEACHER
 
-            with patch("src.bot.handlers.teaching.TeachingService") as mock_service_class:
-                mock_service = mock_service_class.return_value
-                mock_service.join_teacher = AsyncMock()
-                mock_service.get_teacher = AsyncMock(return_value=mock_teacher)
-
-                result = await handle_deep_link_join(mock_message, mock_i18n, db_user, "ABC123")
+        result = await handle_deep_link_join(mock_message, mock_i18n, db_user, "ABC123")
 
         assert result is True
-        mock_session.commit.assert_called_once()
+        assert handler_mocks.session.commit.call_count == 1
         mock_message.answer.assert_called_once()
 
     async def test_returns_false_on_not_found(
@@ -1135,57 +746,45 @@ class TestHandleDeepLinkJoin:
         mock_message: MagicMock,
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
+        record_i18n: I18nRecorder,
+        handler_mocks: SimpleNamespace,
     ) -> None:
         """Helper returns False on invalid code."""
-        with patch("src.bot.handlers.teaching.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-            with patch("src.bot.handlers.teaching.TeachingService") as mock_service_class:
-                mock_service = mock_service_class.return_value
-                mock_service.join_teacher = AsyncMock(side_effect=NotFoundError())
+        handler_mocks.service.join_teacher.side_effect = NotFoundError()
 
-                result = await handle_deep_link_join(mock_message, mock_i18n, db_user, "INVALID")
+        result = await handle_deep_link_join(mock_message, mock_i18n, db_user, "INVALID")
 
         assert result is False
-        mock_i18n.get.assert_any_call("teaching-join-invalid")
+        assert "teaching-join-invalid" in record_i18n.keys
 
     async def test_returns_false_on_self_join(
         self,
         mock_message: MagicMock,
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
+        record_i18n: I18nRecorder,
+        handler_mocks: SimpleNamespace,
     ) -> None:
         """Helper returns False when trying to join self."""
-        with patch("src.bot.handlers.teaching.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
+        handler_mocks.service.join_teacher.side_effect = ValidationError()
 
-            with patch("src.bot.handlers.teaching.TeachingService") as mock_service_class:
-                mock_service = mock_service_class.return_value
-                mock_service.join_teacher = AsyncMock(side_effect=ValidationError())
-
-                result = await handle_deep_link_join(mock_message, mock_i18n, db_user, "SELFCODE")
+        result = await handle_deep_link_join(mock_message, mock_i18n, db_user, "SELFCODE")
 
         assert result is False
-        mock_i18n.get.assert_any_call("teaching-join-self")
+        assert "teaching-join-self" in record_i18n.keys
 
     async def test_returns_false_on_conflict(
         self,
         mock_message: MagicMock,
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
+        record_i18n: I18nRecorder,
+        handler_mocks: SimpleNamespace,
     ) -> None:
         """Helper returns False when already joined."""
-        with patch("src.bot.handlers.teaching.AsyncSessionMaker") as mock_session_maker:
-            mock_session = AsyncMock()
-            mock_session_maker.return_value.__aenter__.return_value = mock_session
-
-            with patch("src.bot.handlers.teaching.TeachingService") as mock_service_class:
-                mock_service = mock_service_class.return_value
-                mock_service.join_teacher = AsyncMock(side_effect=ConflictError())
+        handler_mocks.service.join_teacher.side_effect = ConflictError()
 
-                result = await handle_deep_link_join(mock_message, mock_i18n, db_user, "DUPLICATE")
+        result = await handle_deep_link_join(mock_message, mock_i18n, db_user, "DUPLICATE")
 
         assert result is False
-        mock_i18n.get.assert_any_call("teaching-join-already")
+        assert "teaching-join-already" in record_i18n.keys
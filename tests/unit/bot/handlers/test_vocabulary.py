@@ -12,6 +12,7 @@ from src.bot.handlers.vocabulary import (
     show_vocabulary_page,
 )
 from src.modules.users.dto import UserReadDTO
+from tests.mimic.i18n import I18nRecorder
 
 
 class TestOnVocabList:
@@ -170,6 +171,7 @@ class TestShowVocabularyPage:
         db_user: UserReadDTO,
         mock_state: MagicMock,
         mock_message: MagicMock,
+        record_i18n: I18nRecorder,
     ) -> None:
         """Handler shows empty message when no vocabulary items."""
         mock_callback.message = mock_message
@@ -188,7 +190,7 @@ class TestShowVocabularyPage:
 
                 await show_vocabulary_page(mock_callback, mock_i18n, db_user, mock_state, page=0)
 
-        mock_i18n.get.assert_any_call("vocab-empty")
+        assert "vocab-empty" in record_i18n.keys
         mock_callback.answer.assert_called_once()
 
     async def test_shows_vocabulary_list(
@@ -463,6 +465,7 @@ class TestOnTextInput:
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_state: MagicMock,
+        record_i18n: I18nRecorder,
     ) -> None:
         """Handler adds word to vocabulary when found in dictionary."""
         mock_state.get_state = AsyncMock(return_value=None)
@@ -500,7 +503,7 @@ class TestOnTextInput:
         mock_service.add_word_with_translation.assert_called_once()
         mock_session.commit.assert_called_once()
         mock_message.answer.assert_called_once()
-        mock_i18n.get.assert_any_call("word-added", word="hello", phonetic="\n/həˈloʊ/", translation="привет")  # noqa: RUF001
+        assert ("word-added", {"word": "hello", "phonetic": "\n/həˈloʊ/", "translation": "привет"}) in record_i18n.calls  # noqa: RUF001
 
     async def test_adds_word_without_phonetic(
         self,
@@ -508,6 +511,7 @@ class TestOnTextInput:
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_state: MagicMock,
+        record_i18n: I18nRecorder,
     ) -> None:
         """Handler adds word without phonetic transcription."""
         mock_state.get_state = AsyncMock(return_value=None)
@@ -540,7 +544,7 @@ class TestOnTextInput:
                 await on_text_input(mock_message, mock_i18n, db_user, mock_state)
 
         # Phonetic should be empty string when None
-        mock_i18n.get.assert_any_call("word-added", word="test", phonetic="", translation="тест")
+        assert ("word-added", {"word": "test", "phonetic": "", "translation": "тест"}) in record_i18n.calls
 
     async def test_handles_word_already_exists_conflict(
         self,
@@ -548,6 +552,7 @@ class TestOnTextInput:
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_state: MagicMock,
+        record_i18n: I18nRecorder,
     ) -> None:
         """Handler handles ConflictError when word already exists."""
         from src.core.exceptions import ConflictError
@@ -574,7 +579,7 @@ class TestOnTextInput:
                 await on_text_input(mock_message, mock_i18n, db_user, mock_state)
 
         mock_message.answer.assert_called_once()
-        mock_i18n.get.assert_any_call("word-already-exists")
+        assert "word-already-exists" in record_i18n.keys
 
     async def test_asks_for_translation_when_word_not_found(
         self,
@@ -582,6 +587,7 @@ class TestOnTextInput:
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_state: MagicMock,
+        record_i18n: I18nRecorder,
     ) -> None:
         """Handler asks for translation when word not found in dictionary."""
         mock_state.get_state = AsyncMock(return_value=None)
@@ -600,7 +606,7 @@ class TestOnTextInput:
         mock_state.update_data.assert_called_with(pending_word="unknownword")
         mock_state.set_state.assert_called_once_with(LearnStates.waiting_for_translation)
         mock_message.answer.assert_called_once()
-        mock_i18n.get.assert_any_call("word-not-found-enter-translation", word="unknownword")
+        assert ("word-not-found-enter-translation", {"word": "unknownword"}) in record_i18n.calls
 
 
 class TestOnNoop:
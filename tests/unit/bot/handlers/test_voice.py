@@ -13,6 +13,7 @@ from src.bot.handlers.voice import (
     on_voice_start,
 )
 from src.modules.users.dto import UserReadDTO
+from tests.mimic.i18n import I18nRecorder
 
 
 class TestOnVoiceStart:
@@ -53,6 +54,7 @@ class TestOnVoiceStart:
         db_user: UserReadDTO,
         mock_state: MagicMock,
         mock_message: MagicMock,
+        record_i18n: I18nRecorder,
     ) -> None:
         """Handler shows 'no words' when no words for pronunciation."""
         mock_callback.message = mock_message
@@ -70,7 +72,7 @@ class TestOnVoiceStart:
 
                 await on_voice_start(mock_callback, mock_i18n, db_user, mock_state)
 
-        mock_i18n.get.assert_any_call("voice-no-words")
+        assert "voice-no-words" in record_i18n.keys
         mock_safe_edit.assert_called_once()
         mock_callback.answer.assert_called_once()
 
@@ -257,6 +259,7 @@ class TestOnVoiceNext:
         mock_i18n: MagicMock,
         mock_state: MagicMock,
         mock_message: MagicMock,
+        record_i18n: I18nRecorder,
     ) -> None:
         """Handler completes session without stats when no log IDs."""
         mock_callback.message = mock_message
@@ -277,7 +280,7 @@ class TestOnVoiceNext:
 
         mock_state.clear.assert_called_once()
         mock_safe_edit.assert_called_once()
-        mock_i18n.get.assert_any_call("voice-session-ended")
+        assert "voice-session-ended" in record_i18n.keys
 
     async def test_moves_to_next_word(
         self,
@@ -9,6 +9,7 @@ from src.bot.handlers.word_lists import (
     on_noop,
 )
 from src.modules.users.dto import UserReadDTO
+from tests.mimic.i18n import I18nRecorder
 
 
 class TestOnListsShow:
@@ -46,6 +47,7 @@ class TestOnListsShow:
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_message: MagicMock,
+        record_i18n: I18nRecorder,
     ) -> None:
         """Handler shows empty message when no word lists available."""
         mock_callback.message = mock_message
@@ -53,7 +55,7 @@ class TestOnListsShow:
         with patch("src.bot.handlers.word_lists.get_word_lists_by_language", return_value=[]):
             await on_lists_show(mock_callback, mock_i18n, db_user)
 
-        mock_i18n.get.assert_any_call("lists-empty")
+        assert "lists-empty" in record_i18n.keys
         mock_callback.answer.assert_called_once()
 
     async def test_shows_word_lists(
@@ -124,6 +126,7 @@ class TestOnListPreview:
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_message: MagicMock,
+        record_i18n: I18nRecorder,
     ) -> None:
         """Handler shows alert when word list not found."""
         mock_callback.data = "lists:preview:nonexistent"
@@ -133,7 +136,7 @@ class TestOnListPreview:
             await on_list_preview(mock_callback, mock_i18n, db_user)
 
         mock_callback.answer.assert_called_once()
-        mock_i18n.get.assert_any_call("list-not-found")
+        assert "list-not-found" in record_i18n.keys
 
     async def test_shows_list_preview(
         self,
@@ -209,6 +212,7 @@ class TestOnListAdd:
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_message: MagicMock,
+        record_i18n: I18nRecorder,
     ) -> None:
         """Handler shows alert when word list not found."""
         mock_callback.data = "lists:add:nonexistent"
@@ -218,7 +222,7 @@ class TestOnListAdd:
             await on_list_add(mock_callback, mock_i18n, db_user)
 
         mock_callback.answer.assert_called_once()
-        mock_i18n.get.assert_any_call("list-not-found")
+        assert "list-not-found" in record_i18n.keys
 
     async def test_shows_alert_when_list_already_added(
         self,
@@ -226,6 +230,7 @@ class TestOnListAdd:
         mock_i18n: MagicMock,
         db_user: UserReadDTO,
         mock_message: MagicMock,
+        record_i18n: I18nRecorder,
     ) -> None:
         """Handler shows alert when list is already added."""
         mock_callback.data = "lists:add:food"
@@ -249,7 +254,7 @@ class TestOnListAdd:
                 await on_list_add(mock_callback, mock_i18n, db_user)
 
         mock_callback.answer.assert_called_once()
-        mock_i18n.get.assert_any_call("list-already-added")
+        assert "list-already-added" in record_i18n.keys
 
     async def test_adds_words_from_list(
         self,
@@ -301,9 +306,10 @@ class TestOnNoop:
         self,
         mock_callback: MagicMock,
         mock_i18n: MagicMock,
+        record_i18n: I18nRecorder,
     ) -> None:
         """Handler answers callback with list already added message."""
         await on_noop(mock_callback, mock_i18n)
 
         mock_callback.answer.assert_called_once()
-        mock_i18n.get.assert_any_call("list-already-added")
+        assert "list-already-added" in record_i18n.keys